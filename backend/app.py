@@ -7,20 +7,26 @@ vision processing, and real-time event streaming via SSE.
 """
 
 import asyncio
-import json
+import logging
 import os
+import time
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from typing import List, Optional
 
+import msgspec
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, status
+from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from backend.core.event_bus import Event, EventBus, EventType
+from backend.core.logging_config import configure_logging
 from backend.core.module_registry import ModuleInfo, ModuleRegistry
-from backend.modules.eye import EyeModule
+from backend.modules.eye import EyeModule, create_detection_pool
 from backend.modules.brain import BrainModule
 
 # Load environment variables from .env file
@@ -29,19 +35,77 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 ENV_PATH = os.path.join(BASE_DIR, '.env')
 load_dotenv(ENV_PATH)
 
+logger = logging.getLogger(__name__)
+
+monotonic = time.monotonic
+
+# Maximum number of events sent to an SSE client before yielding to the loop
+SSE_BATCH_SIZE = 64
+# Seconds of inactivity after which a keepalive comment is sent
+SSE_HEARTBEAT_INTERVAL = 15.0
+
 
 # Pydantic models for API requests/responses
 
-class PublishEventRequest(BaseModel):
+# Request bodies are decoded with msgspec, which validates while parsing and
+# avoids building pydantic models for large payloads such as webcam frames.
+
+class PublishEventRequest(msgspec.Struct, frozen=True):
     """Request model for publishing events."""
-    source_module: str = Field(..., description="Module publishing the event")
-    type: str = Field(..., description="Event type")
-    payload: dict = Field(..., description="Event payload data")
+    source_module: str
+    type: str
+    payload: dict
 
 
-class VisionFrameRequest(BaseModel):
+class VisionFrameRequest(msgspec.Struct, frozen=True):
     """Request model for vision frame processing."""
-    frame: str = Field(..., description="Base64-encoded image data")
+    frame: str
+
+
+_publish_event_decoder = msgspec.json.Decoder(PublishEventRequest)
+_vision_frame_decoder = msgspec.json.Decoder(VisionFrameRequest)
+
+
+def _decode_body(decoder: msgspec.json.Decoder, body: bytes):
+    """
+    Decode and validate a JSON request body.
+    
+    Raises:
+        HTTPException: 400 if the body is not valid JSON or fails validation
+    """
+    try:
+        return decoder.decode(body)
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid request body: {e}"
+        )
+
+
+def _json_request_body(struct_type: type) -> dict:
+    """
+    Describe a msgspec-decoded JSON request body for the OpenAPI schema.
+    
+    Bodies decoded in a dependency aren't declared as parameters, so FastAPI
+    can't document them itself; pass this as the route's openapi_extra.
+    """
+    _, components = msgspec.json.schema_components([struct_type])
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": components[struct_type.__name__]}}
+        }
+    }
+
+
+async def decode_publish_event_request(request: Request) -> PublishEventRequest:
+    """Dependency that decodes the body of POST /api/events."""
+    return _decode_body(_publish_event_decoder, await request.body())
+
+
+async def decode_vision_frame_request(request: Request) -> VisionFrameRequest:
+    """Dependency that decodes the body of POST /api/vision/frame."""
+    return _decode_body(_vision_frame_decoder, await request.body())
 
 
 class VisionFrameResponse(BaseModel):
@@ -50,6 +114,15 @@ class VisionFrameResponse(BaseModel):
     processing_time_ms: float = Field(..., description="Processing time in milliseconds")
 
 
+class ModuleResponse(BaseModel):
+    """Response model for module information."""
+    id: str
+    name: str
+    description: str
+    enabled: bool
+    capabilities: List[str]
+
+
 class EventResponse(BaseModel):
     """Response model for events."""
     id: str
@@ -81,28 +154,38 @@ async def lifespan(app: FastAPI):
     """
     global event_bus, module_registry, eye_module, brain_module
     
+    log_listener = configure_logging()
+    
     # Initialize core components
     event_bus = EventBus(max_log_size=1000)
     module_registry = ModuleRegistry()
     
-    # Initialize Eye module
-    eye_module = EyeModule(event_bus, module_registry)
+    # Initialize Eye module, running face detection in worker processes so
+    # CPU-bound OpenCV work doesn't hold the GIL on the event loop
+    # (EYE_PROCESS_WORKERS=0 uses a thread pool in the API process instead)
+    detection_workers = int(os.getenv("EYE_PROCESS_WORKERS", str(os.cpu_count() or 1)))
+    detection_pool = create_detection_pool(detection_workers) if detection_workers > 0 else None
+    eye_module = EyeModule(event_bus, module_registry, executor=detection_pool)
     
     # Initialize Brain module (if API key available)
     try:
         api_key = os.getenv("GEMINI_API_KEY")
         if api_key:
             brain_module = BrainModule(event_bus, module_registry, api_key)
-            print("Brain module initialized with Gemini API")
+            logger.info("Brain module initialized with Gemini API")
         else:
-            print("Warning: GEMINI_API_KEY not set, Brain module not initialized")
+            logger.warning("GEMINI_API_KEY not set, Brain module not initialized")
     except Exception as e:
-        print(f"Warning: Failed to initialize Brain module: {e}")
+        logger.warning("Failed to initialize Brain module: %s", e)
     
     yield
     
-    # Cleanup (if needed)
-    pass
+    # Cleanup
+    eye_module.shutdown()
+    if detection_pool is not None:
+        detection_pool.shutdown(wait=False, cancel_futures=True)
+    event_bus.shutdown()
+    log_listener.stop()
 
 
 # Create FastAPI app
@@ -110,6 +193,7 @@ app = FastAPI(
     title="ChimeraForge",
     version="1.0.0",
     description="Modular AI system backend API",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -123,40 +207,75 @@ app.add_middleware(
 )
 
 
+class StreamSafeGZipMiddleware(GZipMiddleware):
+    """
+    GZip middleware that leaves selected paths uncompressed.
+    
+    The gzip encoder buffers output until it has a full block, which would
+    hold Server-Sent Events back instead of delivering them as they happen.
+    """
+    
+    def __init__(self, app, excluded_paths: tuple = (), **kwargs):
+        super().__init__(app, **kwargs)
+        self.excluded_paths = frozenset(excluded_paths)
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress large responses such as /api/logs (not the SSE stream)
+app.add_middleware(
+    StreamSafeGZipMiddleware,
+    minimum_size=1024,
+    compresslevel=5,
+    excluded_paths=("/api/events/stream",),
+)
+
+
 # Helper functions
 
 def event_to_dict(event: Event) -> dict:
     """Convert Event object to dictionary for JSON serialization."""
-    return {
-        "id": event.id,
-        "source_module": event.source_module,
-        "type": event.type,
-        "timestamp": event.timestamp.isoformat(),
-        "payload": event.payload
-    }
+    return event.to_dict()
+
+
+def events_to_json(events: List[Event]) -> bytes:
+    """Join the cached JSON of each event into a JSON array."""
+    return b"[" + b",".join(event.to_json() for event in events) + b"]"
+
+
+def sse_frame(event: Event) -> bytes:
+    """
+    Encode an event as a Server-Sent Events data frame.
+    
+    Events that cannot be serialized are logged and skipped (empty bytes),
+    so one bad payload doesn't end the stream.
+    """
+    try:
+        return b"data: " + event.to_json() + b"\n\n"
+    except Exception as e:
+        logger.error("Error serializing event %s: %s: %s", event.id, type(e).__name__, e)
+        return b""
 
 
 def module_info_to_dict(module: ModuleInfo) -> dict:
     """Convert ModuleInfo object to dictionary for JSON serialization."""
-    return {
-        "id": module.id,
-        "name": module.name,
-        "description": module.description,
-        "enabled": module.enabled,
-        "capabilities": module.capabilities
-    }
+    return module.to_dict()
 
 
 # API Endpoints
 
 @app.get("/")
-def root():
+async def root():
     """Root endpoint."""
     return {"message": "ChimeraForge Backend API", "version": "1.0.0"}
 
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint."""
     return {
         "status": "ok",
@@ -166,19 +285,18 @@ def health_check():
     }
 
 
-@app.get("/api/modules", response_model=List[dict])
-def get_modules():
+@app.get("/api/modules", responses={200: {"model": List[ModuleResponse]}})
+async def get_modules():
     """
     Get list of all modules with their enabled states.
     
     Returns:
         List of module information objects
     """
-    modules = module_registry.get_all_modules()
-    return [module_info_to_dict(m) for m in modules]
+    return Response(content=module_registry.get_all_modules_json(), media_type="application/json")
 
 
-@app.post("/api/modules/{module_id}/toggle", response_model=dict)
+@app.post("/api/modules/{module_id}/toggle", responses={200: {"model": ModuleResponse}})
 async def toggle_module(module_id: str):
     """
     Toggle the enabled state of a module.
@@ -226,15 +344,19 @@ async def toggle_module(module_id: str):
         raise
     except Exception as e:
         # Log unexpected errors with context
-        print(f"Error toggling module {module_id}: {type(e).__name__}: {e}")
+        logger.exception("Error toggling module %s", module_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to toggle module: {str(e)}"
         )
 
 
-@app.post("/api/events", response_model=dict)
-async def publish_event(request: PublishEventRequest):
+@app.post(
+    "/api/events",
+    responses={200: {"model": EventResponse}},
+    openapi_extra=_json_request_body(PublishEventRequest)
+)
+async def publish_event(request: PublishEventRequest = Depends(decode_publish_event_request)):
     """
     Publish an event to the event bus.
     
@@ -274,24 +396,40 @@ async def publish_event(request: PublishEventRequest):
             payload=request.payload
         )
         
+        # Encode before publishing: an event that can't be serialized (e.g.
+        # an integer beyond 64 bits) would otherwise sit in the log and break
+        # /api/logs and the SSE stream until evicted. The encoding is cached
+        # on the event, so the response below reuses it.
+        try:
+            event.to_json()
+        except orjson.JSONEncodeError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid payload: not JSON-serializable ({e})"
+            )
+        
         await event_bus.publish(event)
         
-        return event_to_dict(event)
+        return Response(content=event.to_json(), media_type="application/json")
     
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
         # Log unexpected errors with context
-        print(f"Error publishing event from {request.source_module}: {type(e).__name__}: {e}")
+        logger.exception("Error publishing event from %s", request.source_module)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to publish event: {str(e)}"
         )
 
 
-@app.post("/api/vision/frame", response_model=VisionFrameResponse)
-async def process_vision_frame(request: VisionFrameRequest):
+@app.post(
+    "/api/vision/frame",
+    responses={200: {"model": VisionFrameResponse}},
+    openapi_extra=_json_request_body(VisionFrameRequest)
+)
+async def process_vision_frame(request: VisionFrameRequest = Depends(decode_vision_frame_request)):
     """
     Process a webcam frame through Eye and Brain modules.
     
@@ -304,8 +442,7 @@ async def process_vision_frame(request: VisionFrameRequest):
     Raises:
         HTTPException: If validation fails or processing fails
     """
-    import time
-    start_time = time.time()
+    start_time = monotonic()
     
     try:
         # Validate input
@@ -322,41 +459,94 @@ async def process_vision_frame(request: VisionFrameRequest):
                 detail="Invalid frame: data too short to be a valid image"
             )
         
-        # Get initial event count
-        initial_event_count = len(event_bus.get_all_events())
+        # Remember where the event log was before processing
+        start_seq = event_bus.last_seq
         
-        # Process frame through Eye module
+        # Process frame through Eye module. Publishing awaits every
+        # subscriber, so the Brain module has already handled the resulting
+        # vision event (and published its action) by the time this returns.
         await eye_module.process_frame(request.frame)
         
-        # Wait a bit for Brain module to process (if enabled)
-        await asyncio.sleep(0.1)
-        
         # Get events generated during processing
-        all_events = event_bus.get_all_events()
-        new_events = all_events[initial_event_count:]
+        _, new_events = event_bus.get_events_since(start_seq)
         
         # Calculate processing time
-        processing_time_ms = (time.time() - start_time) * 1000
+        processing_time_ms = (monotonic() - start_time) * 1000.0
         
-        return VisionFrameResponse(
-            events_generated=[event_to_dict(e) for e in new_events],
-            processing_time_ms=processing_time_ms
+        return {
+            "events_generated": [event_to_dict(e) for e in new_events],
+            "processing_time_ms": processing_time_ms
+        }
+    
+    except HTTPException:
+        # Re-raise HTTP exceptions
+        raise
+    except Exception as e:
+        # Log unexpected errors with context
+        logger.exception("Error processing vision frame")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process frame: {str(e)}"
         )
+
+
+@app.post("/api/vision/frame-binary", responses={200: {"model": VisionFrameResponse}})
+async def process_vision_frame_binary(request: Request):
+    """
+    Process a webcam frame sent as raw encoded image bytes.
+    
+    Same as /api/vision/frame, but the body is the JPEG/PNG file itself
+    (Content-Type: application/octet-stream), which avoids the base64
+    overhead on the wire and the decode step on the server.
+    
+    Returns:
+        Processing results including generated events
+    
+    Raises:
+        HTTPException: If validation fails or processing fails
+    """
+    start_time = monotonic()
+    
+    try:
+        frame_bytes = await request.body()
+        
+        # Validate input
+        if len(frame_bytes) < 10:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid frame: data too short to be a valid image"
+            )
+        
+        # Remember where the event log was before processing
+        start_seq = event_bus.last_seq
+        
+        await eye_module.process_frame_bytes(frame_bytes)
+        
+        # Get events generated during processing
+        _, new_events = event_bus.get_events_since(start_seq)
+        
+        # Calculate processing time
+        processing_time_ms = (monotonic() - start_time) * 1000.0
+        
+        return {
+            "events_generated": [event_to_dict(e) for e in new_events],
+            "processing_time_ms": processing_time_ms
+        }
     
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
         # Log unexpected errors with context
-        print(f"Error processing vision frame: {type(e).__name__}: {e}")
+        logger.exception("Error processing binary vision frame")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process frame: {str(e)}"
         )
 
 
-@app.get("/api/logs", response_model=List[dict])
-def get_logs(limit: int = 50):
+@app.get("/api/logs", responses={200: {"model": List[EventResponse]}})
+async def get_logs(limit: int = 50):
     """
     Get recent events from the event bus log.
     
@@ -384,14 +574,14 @@ def get_logs(limit: int = 50):
             )
         
         events = event_bus.get_recent_events(limit=limit)
-        return [event_to_dict(e) for e in events]
+        return Response(content=events_to_json(events), media_type="application/json")
     
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
         # Log unexpected errors with context
-        print(f"Error retrieving logs (limit={limit}): {type(e).__name__}: {e}")
+        logger.exception("Error retrieving logs (limit=%s)", limit)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve logs: {str(e)}"
@@ -408,42 +598,46 @@ async def stream_events():
     """
     async def event_generator():
         """Generate SSE events from the event bus."""
-        # Track last seen event index
-        last_index = len(event_bus.get_all_events())
+        # Track last seen event sequence number
+        last_seq = event_bus.last_seq
         
         try:
             while True:
                 try:
-                    # Get all events
-                    all_events = event_bus.get_all_events()
+                    # Sleep until something new is published, sending a
+                    # keepalive comment so idle proxies don't drop the stream
+                    try:
+                        await asyncio.wait_for(
+                            event_bus.wait_for_events(last_seq),
+                            timeout=SSE_HEARTBEAT_INTERVAL
+                        )
+                    except asyncio.TimeoutError:
+                        yield b": keepalive\n\n"
+                        continue
                     
-                    # Send new events
-                    if len(all_events) > last_index:
-                        new_events = all_events[last_index:]
-                        for event in new_events:
-                            try:
-                                event_data = json.dumps(event_to_dict(event))
-                                yield f"data: {event_data}\n\n"
-                            except Exception as e:
-                                # Log error serializing individual event but continue
-                                print(f"Error serializing event {event.id}: {type(e).__name__}: {e}")
-                        
-                        last_index = len(all_events)
+                    # Send new events in bounded batches so a client that
+                    # fell behind doesn't monopolize the loop
+                    last_seq, new_events = event_bus.get_events_since(last_seq, limit=SSE_BATCH_SIZE)
+                    if len(new_events) == 1:
+                        yield sse_frame(new_events[0])
+                    elif new_events:
+                        # One chunk per batch instead of one write per event
+                        yield b"".join(sse_frame(event) for event in new_events)
                     
-                    # Wait before checking for new events
-                    await asyncio.sleep(0.1)
+                    # Let other coroutines run before the next batch
+                    await asyncio.sleep(0)
                 
                 except Exception as e:
                     # Log error but keep stream alive for graceful degradation
-                    print(f"Error in SSE event generator: {type(e).__name__}: {e}")
+                    logger.exception("Error in SSE event generator")
                     await asyncio.sleep(1)  # Wait longer on error
         
         except asyncio.CancelledError:
             # Client disconnected - this is normal
-            print("SSE client disconnected")
+            logger.debug("SSE client disconnected")
         except Exception as e:
             # Log unexpected errors
-            print(f"Fatal error in SSE stream: {type(e).__name__}: {e}")
+            logger.exception("Fatal error in SSE stream")
     
     return StreamingResponse(
         event_generator(),
@@ -454,3 +648,18 @@ async def stream_events():
             "X-Accel-Buffering": "no",  # Disable buffering for Nginx (Render/Vercel)
         }
     )
+
+
+if __name__ == "__main__":
+    import uvicorn
+    
+    # uvloop and httptools ship with uvicorn[standard]; uvloop is not
+    # available on Windows, where uvicorn's default asyncio loop is used.
+    uvicorn.run(
+        "backend.app:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop" if os.name != "nt" else "auto",
+        http="httptools",
+        log_level="warning"
+    )
@@ -6,14 +6,51 @@ through a publish-subscribe pattern.
 """
 
 import asyncio
-import uuid
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
-from collections import deque
+from collections import defaultdict, deque
+from itertools import count, islice
 
+import orjson
 
-@dataclass
+
+logger = logging.getLogger(__name__)
+
+
+def _format_event_id(raw: bytearray) -> str:
+    """Format 16 random bytes as a version 4 UUID string."""
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _new_event_id() -> str:
+    """
+    Generate a random (version 4) UUID string.
+    
+    Formats the random bytes directly instead of going through uuid.uuid4(),
+    which builds a UUID object only for it to be converted back to a string.
+    """
+    return _format_event_id(bytearray(os.urandom(16)))
+
+
+def _new_event_ids(n: int) -> List[str]:
+    """Generate n random UUID strings from a single read of the OS entropy source."""
+    raw = os.urandom(16 * n)
+    return [_format_event_id(bytearray(raw[i:i + 16])) for i in range(0, 16 * n, 16)]
+
+
+# Source of Event.seq; itertools.count is atomic under the GIL
+_event_counter = count(1)
+
+
+@dataclass(slots=True, frozen=True)
 class Event:
     """
     Represents an event in the ChimeraForge system.
@@ -24,12 +61,18 @@ class Event:
         type: Event type constant (e.g., "VISION_EVENT", "SYSTEM_ACTION")
         timestamp: When the event was created
         payload: Event-specific data
+        seq: Creation order of the event within the process (not serialized)
+        created_ns: time.perf_counter_ns() at creation, for measuring delivery
+            latency on a monotonic clock (not serialized)
     """
     id: str
     source_module: str
     type: str
     timestamp: datetime
     payload: Dict[str, Any]
+    seq: int = field(default=0, compare=False)
+    created_ns: int = field(default=0, compare=False)
+    _json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def create(cls, source_module: str, type: str, payload: Dict[str, Any]) -> "Event":
@@ -40,17 +83,88 @@ class Event:
             source_module: Module publishing the event
             type: Event type
             payload: Event data
-            
+        
         Returns:
             New Event instance
         """
         return cls(
-            id=str(uuid.uuid4()),
+            id=_new_event_id(),
             source_module=source_module,
             type=type,
             timestamp=datetime.now(timezone.utc),
-            payload=payload
+            payload=payload,
+            seq=next(_event_counter),
+            created_ns=time.perf_counter_ns()
         )
+    
+    @classmethod
+    def create_many(cls, source_module: str, type: str, payloads: Sequence[Dict[str, Any]]) -> List["Event"]:
+        """
+        Create one event per payload, all from the same source and of the same type.
+        
+        The IDs are cut from a single os.urandom call and the events share
+        one timestamp, so building a batch costs one syscall and clock read
+        instead of one per event.
+        
+        Args:
+            source_module: Module publishing the events
+            type: Event type
+            payloads: Event data, one entry per event
+        
+        Returns:
+            New Event instances in payload order
+        """
+        timestamp = datetime.now(timezone.utc)
+        created_ns = time.perf_counter_ns()
+        return [
+            cls(
+                id=event_id,
+                source_module=source_module,
+                type=type,
+                timestamp=timestamp,
+                payload=payload,
+                seq=next(_event_counter),
+                created_ns=created_ns
+            )
+            for event_id, payload in zip(_new_event_ids(len(payloads)), payloads)
+        ]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the event to a JSON-compatible dictionary."""
+        return {
+            "id": self.id,
+            "source_module": self.source_module,
+            "type": self.type,
+            "timestamp": self.timestamp.isoformat(),
+            "payload": self.payload
+        }
+    
+    def to_json(self) -> bytes:
+        """
+        Serialize the event to JSON bytes.
+        
+        Events are immutable, so the encoded form is computed on first use
+        and reused by every later response and stream.
+        
+        Returns:
+            UTF-8 encoded JSON object
+        """
+        if self._json is None:
+            # Bypass the frozen __setattr__ to fill the cache slot
+            object.__setattr__(self, "_json", orjson.dumps(self.to_dict()))
+        return self._json
+
+
+def _call_for_each(callback: Callable, events: Sequence[Event]) -> None:
+    """Call a sync subscriber for each event, isolating failures per event."""
+    for event in events:
+        try:
+            callback(event)
+        except Exception as e:
+            logger.error(
+                "Error delivering event %s (type: %s) to subscriber: %s: %s",
+                event.id, event.type, type(e).__name__, e
+            )
 
 
 class EventBus:
@@ -63,16 +177,39 @@ class EventBus:
     - Multiple subscribers per module
     """
     
-    def __init__(self, max_log_size: int = 1000):
+    def __init__(self, max_log_size: int = 1000, max_sync_workers: int = 4):
         """
         Initialize the event bus.
         
         Args:
             max_log_size: Maximum number of events to keep in the log
+            max_sync_workers: Threads available for running sync callbacks
         """
-        self._subscribers: Dict[str, List[Callable]] = {}
+        # (callback, is_coroutine) pairs, classified once at subscribe time
+        self._subscribers: Dict[str, List[Tuple[Callable, bool]]] = {}
+        # Flattened snapshot of all callbacks, rebuilt on (un)subscribe
+        self._callbacks: Tuple[Tuple[Callable, bool], ...] = ()
+        # Dedicated pool so sync subscribers don't compete with other
+        # users of the loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_sync_workers,
+            thread_name_prefix="event-bus"
+        )
+        self._max_log_size = max_log_size
         self._event_log: deque = deque(maxlen=max_log_size)
-        self._lock = asyncio.Lock()
+        # Per-type views of the log, kept in step with it on publish/eviction
+        self._events_by_type: Dict[str, deque] = defaultdict(deque)
+        # Number of logged events per (type, source module)
+        self._counts: Dict[Tuple[str, str], int] = defaultdict(int)
+        # Notified on publish to wake stream readers blocked in wait_for_events
+        self._cond = asyncio.Condition()
+        self._waiting_readers = 0
+        # Publishes still delivering to subscribers; drain waits for idle
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        # Sequence number of the most recently published event
+        self._seq = 0
     
     async def publish(self, event: Event) -> None:
         """
@@ -81,54 +218,170 @@ class EventBus:
         Args:
             event: Event to publish
         """
-        # Store event in log
-        async with self._lock:
-            self._event_log.append(event)
+        # Store event in log. Nothing awaits between the append and the
+        # sequence bump, so readers on the loop always see both or neither.
+        self._log_event(event)
+        self._seq += 1
+        
+        # Wake readers waiting for new events (the condition is only
+        # acquired when someone is actually waiting)
+        if self._waiting_readers:
+            async with self._cond:
+                self._cond.notify_all()
+        
+        # Deliver to all subscribers, concurrently when there is more than one
+        callbacks = self._callbacks
+        if not callbacks:
+            return
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            if len(callbacks) == 1:
+                callback, is_coroutine = callbacks[0]
+                await self._deliver_event(callback, is_coroutine, event)
+            else:
+                await asyncio.gather(
+                    *(
+                        self._deliver_event(callback, is_coroutine, event)
+                        for callback, is_coroutine in callbacks
+                    ),
+                    return_exceptions=True
+                )
+        finally:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._idle.set()
+    
+    async def drain(self) -> None:
+        """
+        Wait until no publish is still delivering to subscribers.
+        
+        A publish returns only after its own deliveries finish, so this is
+        for waiting on publishes running in other tasks (e.g. background
+        frame processing) without sleeping for a guessed interval.
+        """
+        await self._idle.wait()
+    
+    async def publish_many(self, events: Sequence[Event]) -> None:
+        """
+        Publish a batch of events, in order, to all subscribers.
+        
+        The whole batch is logged before anything is delivered, and each
+        subscriber receives the batch through a single delivery (one thread
+        hop for sync callbacks) instead of one per event.
+        
+        Args:
+            events: Events to publish
+        """
+        if not events:
+            return
+        for event in events:
+            self._log_event(event)
+        self._seq += len(events)
         
-        # Deliver to all subscribers asynchronously
-        tasks = []
-        for module_id, callbacks in self._subscribers.items():
-            for callback in callbacks:
-                # Create task for each callback to enable concurrent delivery
-                tasks.append(self._deliver_event(callback, event))
+        if self._waiting_readers:
+            async with self._cond:
+                self._cond.notify_all()
         
-        # Wait for all deliveries to complete
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        callbacks = self._callbacks
+        if not callbacks:
+            return
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            await asyncio.gather(
+                *(
+                    self._deliver_batch(callback, is_coroutine, events)
+                    for callback, is_coroutine in callbacks
+                ),
+                return_exceptions=True
+            )
+        finally:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._idle.set()
+    
+    def _log_event(self, event: Event) -> None:
+        """Append an event to the log and its per-type index."""
+        log = self._event_log
+        if len(log) == log.maxlen:
+            if not log:
+                # A zero-size log keeps nothing, so neither does the index
+                return
+            # The oldest event is about to be evicted; it is also the oldest
+            # of its type
+            evicted = self._events_by_type[log[0].type].popleft()
+            self._counts[evicted.type, evicted.source_module] -= 1
+        log.append(event)
+        self._events_by_type[event.type].append(event)
+        self._counts[event.type, event.source_module] += 1
     
-    async def _deliver_event(self, callback: Callable, event: Event) -> None:
+    async def _deliver_batch(self, callback: Callable, is_coroutine: bool, events: Sequence[Event]) -> None:
+        """
+        Deliver a batch of events, in order, to a single subscriber callback.
+        
+        Args:
+            callback: Subscriber callback function
+            is_coroutine: Whether the callback is an async function
+            events: Events to deliver
+        """
+        if is_coroutine:
+            for event in events:
+                await self._deliver_event(callback, True, event)
+        else:
+            # One executor round trip for the whole batch
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, _call_for_each, callback, events)
+    
+    async def _deliver_event(self, callback: Callable, is_coroutine: bool, event: Event) -> None:
         """
         Deliver an event to a single subscriber callback.
         
         Args:
             callback: Subscriber callback function
+            is_coroutine: Whether the callback is an async function
             event: Event to deliver
         """
         try:
-            # Check if callback is async or sync
-            if asyncio.iscoroutinefunction(callback):
+            if is_coroutine:
                 await callback(event)
             else:
                 # Run sync callback in executor to avoid blocking
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, callback, event)
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._executor, callback, event)
         except Exception as e:
             # Log error with context but don't let one subscriber failure affect others
-            print(f"Error delivering event {event.id} (type: {event.type}) to subscriber: {type(e).__name__}: {e}")
+            logger.error(
+                "Error delivering event %s (type: %s) to subscriber: %s: %s",
+                event.id, event.type, type(e).__name__, e
+            )
             # Store delivery failure in a separate error log if needed
             # This ensures system resilience - one module failure doesn't crash the event bus
     
-    def subscribe(self, module_id: str, callback: Callable) -> None:
+    def subscribe(self, module_id: str, callback: Callable, inline: bool = False) -> None:
         """
         Subscribe a module to receive events.
         
+        Sync callbacks run on the bus's thread pool so they can't block the
+        event loop. Cheap ones (e.g. appending to a list) can instead be
+        subscribed with inline=True to be called directly on the loop,
+        skipping the thread hop.
+        
         Args:
             module_id: Unique identifier for the subscribing module
             callback: Function to call when events are published
+            inline: Call a sync callback directly on the event loop
         """
-        if module_id not in self._subscribers:
-            self._subscribers[module_id] = []
-        self._subscribers[module_id].append(callback)
+        is_coroutine = asyncio.iscoroutinefunction(callback)
+        if inline and not is_coroutine:
+            sync_callback = callback
+            
+            async def callback(event: Event) -> None:
+                sync_callback(event)
+            
+            is_coroutine = True
+        self._subscribers.setdefault(module_id, []).append((callback, is_coroutine))
+        self._rebuild_callbacks()
     
     def unsubscribe(self, module_id: str) -> None:
         """
@@ -139,6 +392,19 @@ class EventBus:
         """
         if module_id in self._subscribers:
             del self._subscribers[module_id]
+            self._rebuild_callbacks()
+    
+    def _rebuild_callbacks(self) -> None:
+        """Refresh the flattened callback snapshot used by publish."""
+        self._callbacks = tuple(
+            entry
+            for entries in self._subscribers.values()
+            for entry in entries
+        )
+    
+    def shutdown(self) -> None:
+        """Release the threads used for sync callbacks."""
+        self._executor.shutdown(wait=False)
     
     def get_recent_events(self, limit: int = 50) -> List[Event]:
         """
@@ -146,13 +412,165 @@ class EventBus:
         
         Args:
             limit: Maximum number of events to return
-            
+        
         Returns:
             List of recent events in chronological order
         """
-        # Convert deque to list and return last N events
-        events = list(self._event_log)
-        return events[-limit:] if len(events) > limit else events
+        # Walk back from the newest entry so only the last N events are copied
+        events = list(islice(reversed(self._event_log), limit))
+        events.reverse()
+        return events
+    
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recently published event."""
+        return self._seq
+    
+    def get_events_since(self, last_seq: int, limit: Optional[int] = None) -> Tuple[int, List[Event]]:
+        """
+        Get events published after the given sequence number.
+        
+        Only the new events are copied, so callers that poll frequently pay
+        for what changed rather than for the whole log. Events that have
+        already been evicted from the log are skipped.
+        
+        Args:
+            last_seq: Sequence number the caller has already seen
+            limit: Maximum number of (oldest) new events to return
+        
+        Returns:
+            Tuple of (sequence number of the last returned event,
+            new events in chronological order)
+        """
+        seq = self._seq
+        if last_seq >= seq:
+            return seq, []
+        
+        available = min(seq - last_seq, len(self._event_log))
+        count = available if limit is None else min(available, limit)
+        skipped = available - count
+        
+        # Walk back from the newest entry, skipping events beyond the limit
+        events = list(islice(reversed(self._event_log), skipped, available))
+        events.reverse()
+        return seq - skipped, events
+    
+    async def wait_for_events(self, last_seq: int) -> None:
+        """
+        Wait until an event newer than last_seq has been published.
+        
+        Args:
+            last_seq: Sequence number the caller has already seen
+        """
+        if self._seq > last_seq:
+            return
+        self._waiting_readers += 1
+        try:
+            async with self._cond:
+                await self._cond.wait_for(lambda: self._seq > last_seq)
+        finally:
+            self._waiting_readers -= 1
+    
+    def get_events_by_type(self, event_type: str) -> List[Event]:
+        """
+        Get all logged events of one type.
+        
+        Args:
+            event_type: Event type to select
+        
+        Returns:
+            Events of that type in chronological order
+        """
+        events = self._events_by_type.get(event_type)
+        return list(events) if events else []
+    
+    def get_events_by(self, event_type: str, source_module: Optional[str] = None) -> List[Event]:
+        """
+        Get logged events of one type, optionally from one source module.
+        
+        Only events of the requested type are scanned, via the per-type index.
+        
+        Args:
+            event_type: Event type to select
+            source_module: Source module to select, or None for any source
+        
+        Returns:
+            Matching events in chronological order
+        """
+        if source_module is None:
+            return self.get_events_by_type(event_type)
+        return [
+            e for e in self.iter_events_by_type(event_type)
+            if e.source_module == source_module
+        ]
+    
+    def count_events(self, event_type: str, source_module: Optional[str] = None) -> int:
+        """
+        Count logged events of one type, optionally from one source module.
+        
+        Args:
+            event_type: Event type to count
+            source_module: Source module to count, or None for any source
+        
+        Returns:
+            Number of matching events in the log
+        """
+        if source_module is None:
+            events = self._events_by_type.get(event_type)
+            return len(events) if events else 0
+        return self._counts.get((event_type, source_module), 0)
+    
+    def iter_events(self) -> Iterator[Event]:
+        """
+        Iterate over the logged events without copying the log.
+        
+        The iterator reads the live log, so it must be consumed before the
+        next publish (i.e. without awaiting in between); use get_all_events
+        for a snapshot.
+        
+        Returns:
+            Iterator over all events in chronological order
+        """
+        return iter(self._event_log)
+    
+    @property
+    def log_length(self) -> int:
+        """Number of events currently in the log."""
+        return len(self._event_log)
+    
+    def peek(self, index: int) -> Event:
+        """
+        Get one logged event without copying the log.
+        
+        Access is O(1) near either end of the log (e.g. 0 for the oldest
+        event, -1 for the newest).
+        
+        Args:
+            index: Position in the log, negative to count from the newest
+        
+        Returns:
+            The event at that position
+        
+        Raises:
+            IndexError: If the log has no event at that position
+        """
+        return self._event_log[index]
+    
+    def iter_events_by_type(self, event_type: str) -> Iterator[Event]:
+        """
+        Iterate over the logged events of one type without copying them.
+        
+        Like iter_events, the iterator must be consumed before the next
+        publish; use get_events_by_type for a snapshot.
+        
+        Args:
+            event_type: Event type to select
+        
+        Returns:
+            Iterator over events of that type in chronological order
+        """
+        events = self._events_by_type.get(event_type)
+        return iter(events) if events else iter(())
     
     def get_all_events(self) -> List[Event]:
         """
@@ -166,6 +584,33 @@ class EventBus:
     def clear_log(self) -> None:
         """Clear all events from the log."""
         self._event_log.clear()
+        self._events_by_type.clear()
+        self._counts.clear()
+    
+    def reset(self, max_log_size: Optional[int] = None) -> None:
+        """
+        Return the bus to its freshly constructed state.
+        
+        Clears the log and all subscribers, and recreates the asyncio
+        primitives so the bus can be reused from a different event loop.
+        Must not be called while a publish is still delivering.
+        
+        Args:
+            max_log_size: New log size limit, or None for the size the bus
+                was created with
+        """
+        if max_log_size is None:
+            max_log_size = self._max_log_size
+        self._event_log = deque(maxlen=max_log_size)
+        self.clear_log()
+        self._subscribers.clear()
+        self._rebuild_callbacks()
+        self._cond = asyncio.Condition()
+        self._waiting_readers = 0
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._seq = 0
 
 
 # Event type constants
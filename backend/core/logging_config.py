@@ -0,0 +1,42 @@
+"""
+Logging setup for ChimeraForge.
+
+Records are put on a queue by the calling thread and written out by a
+background QueueListener, so slow handlers never block the event loop.
+"""
+
+import logging
+import logging.handlers
+import os
+import queue
+from typing import Optional
+
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+def configure_logging(level: Optional[str] = None) -> logging.handlers.QueueListener:
+    """
+    Route the backend's loggers through a queue-backed handler.
+    
+    Args:
+        level: Log level name; defaults to the LOG_LEVEL environment variable or INFO
+    
+    Returns:
+        The started QueueListener; call stop() on shutdown to flush it
+    """
+    level = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    
+    # All modules log under the "backend" package logger
+    logger = logging.getLogger("backend")
+    logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    logger.setLevel(level)
+    logger.propagate = False
+    
+    listener.start()
+    return listener
@@ -5,10 +5,12 @@ This module manages the state and capabilities of all system modules.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class ModuleInfo:
     """
     Information about a module in the ChimeraForge system.
@@ -25,6 +27,16 @@ class ModuleInfo:
     description: str
     enabled: bool = False
     capabilities: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the module information to a JSON-compatible dictionary."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "enabled": self.enabled,
+            "capabilities": self.capabilities
+        }
 
 
 class ModuleRegistry:
@@ -69,6 +81,19 @@ class ModuleRegistry:
                 capabilities=["speech_recognition", "voice_input", "audio_processing"]
             )
         }
+        # Encoded module list, rebuilt only after a module state change
+        self._modules_json: Optional[bytes] = None
+    
+    def reset(self) -> None:
+        """
+        Disable every module again, as after construction.
+        
+        Cheaper than building a new registry when one is reused, e.g. across
+        test examples.
+        """
+        for module in self._modules.values():
+            module.enabled = False
+        self._modules_json = None
     
     def get_all_modules(self) -> List[ModuleInfo]:
         """
@@ -79,6 +104,20 @@ class ModuleRegistry:
         """
         return list(self._modules.values())
     
+    def get_all_modules_json(self) -> bytes:
+        """
+        Get information about all modules as a JSON array.
+        
+        Module states only change through toggle_module, so the encoded list
+        is cached and reused until the next toggle.
+        
+        Returns:
+            UTF-8 encoded JSON array of module information
+        """
+        if self._modules_json is None:
+            self._modules_json = orjson.dumps([m.to_dict() for m in self._modules.values()])
+        return self._modules_json
+    
     def get_module(self, module_id: str) -> Optional[ModuleInfo]:
         """
         Get information about a specific module.
@@ -104,6 +143,7 @@ class ModuleRegistry:
         module = self._modules.get(module_id)
         if module:
             module.enabled = not module.enabled
+            self._modules_json = None
             return module
         return None
     
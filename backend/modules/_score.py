@@ -0,0 +1,41 @@
+"""
+Per-detection scoring for the Eye module.
+
+The math is compiled with Numba when it is installed, so richer per-face
+features can be added here without paying Python overhead per frame.
+Without Numba the same functions run as plain Python.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    njit = None
+
+
+def _face_confidence(w: float, h: float, image_height: int, image_width: int) -> float:
+    """
+    Score a detected face by its size relative to the frame.
+    
+    Larger faces are generally more confident detections.
+    
+    Args:
+        w: Face width in full-frame pixels
+        h: Face height in full-frame pixels
+        image_height: Frame height
+        image_width: Frame width
+    
+    Returns:
+        Confidence between 0.0 and 1.0
+    """
+    return min(1.0, (w * h) / (image_height * image_width) * 10.0)
+
+
+if njit is not None:
+    face_confidence = njit(cache=True, fastmath=True)(_face_confidence)
+else:
+    face_confidence = _face_confidence
+
+
+def warm_up() -> None:
+    """Trigger JIT compilation so the first real frame doesn't pay for it."""
+    face_confidence(1.0, 1.0, 1, 1)
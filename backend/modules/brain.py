@@ -4,6 +4,8 @@ Brain Module implementation for ChimeraForge.
 This module provides LLM-powered reasoning capabilities using Google's Gemini API.
 """
 
+import json
+import logging
 import os
 import time
 from dataclasses import dataclass
@@ -13,6 +15,9 @@ from backend.core.event_bus import Event, EventBus, EventType
 from backend.core.module_registry import ModuleRegistry
 
 
+logger = logging.getLogger(__name__)
+
+
 @dataclass
 class BrainResponse:
     """
@@ -89,19 +94,19 @@ class BrainModule:
                 interval = self.hearing_interval
                 
             if current_time - self.last_process_time < interval:
-                print(f"Brain: Skipping event (rate limited, {current_time - self.last_process_time:.1f}s since last)")
+                logger.debug("Skipping event (rate limited, %.1fs since last)", current_time - self.last_process_time)
                 return
             
             # Wrap processing in try-catch for error handling
             try:
-                print(f"Brain: Processing {event.type}...")
+                logger.debug("Processing %s...", event.type)
                 response = await self.generate_response(event)
                 await self._publish_action(response)
                 self.last_process_time = current_time
-                print(f"Brain: Response generated successfully")
+                logger.debug("Response generated successfully")
             except Exception as e:
                 # Log error with context
-                print(f"Error in Brain module processing event {event.id}: {type(e).__name__}: {e}")
+                logger.error("Error in Brain module processing event %s: %s: %s", event.id, type(e).__name__, e)
                 # Publish error event for graceful degradation
                 await self._publish_error_event(
                     error_type="processing",
@@ -174,19 +179,18 @@ class BrainModule:
                     response_text = "".join([part.text for part in parts])
                 else:
                     response_text = ""
-                    print(f"Brain: Could not extract text from response: {response}")
+                    logger.warning("Could not extract text from response: %s", response)
             
             if not response_text:
-                print(f"Brain: Response text is empty. Candidates: {response.candidates}")
+                logger.warning("Response text is empty. Candidates: %s", response.candidates)
                 try:
-                    print(f"Brain: Prompt feedback: {response.prompt_feedback}")
+                    logger.warning("Prompt feedback: %s", response.prompt_feedback)
                 except:
                     pass
 
-            print(f"Brain: Gemini raw response: {response_text[:200]}...")  # Log first 200 chars
+            logger.debug("Gemini raw response: %s...", response_text[:200])  # Log first 200 chars
             
             # Try to parse as JSON, fallback to plain text
-            import json
             try:
                 # Try to extract JSON if it's wrapped in markdown code blocks
                 if "```json" in response_text:
@@ -201,7 +205,7 @@ class BrainModule:
                     response_text = response_text[json_start:json_end].strip()
                 
                 response_data = json.loads(response_text)
-                print(f"Brain: Successfully parsed JSON response")
+                logger.debug("Successfully parsed JSON response")
                 return BrainResponse(
                     text=response_data.get("text", response_text),
                     speak=response_data.get("speak"),
@@ -210,7 +214,7 @@ class BrainModule:
                 )
             except json.JSONDecodeError as e:
                 # If not valid JSON, use the text as-is for speaking
-                print(f"Brain: Response not JSON, using as plain text (will speak it)")
+                logger.debug("Response not JSON, using as plain text (will speak it)")
                 # Use the raw text as both text and speak
                 return BrainResponse(
                     text=response_text,
@@ -221,7 +225,7 @@ class BrainModule:
             # Check for quota exceeded (429)
             error_str = str(e)
             if "429" in error_str or "ResourceExhausted" in type(e).__name__:
-                print(f"Brain: Quota exceeded. Switching to fallback mode.")
+                logger.warning("Quota exceeded. Switching to fallback mode.")
                 fallback_text = "My mind is exhausted... I need to rest for a while."
                 return BrainResponse(
                     text=fallback_text,
@@ -229,9 +233,7 @@ class BrainModule:
                 )
 
             # Log error with full context
-            print(f"ERROR calling Gemini API: {type(e).__name__}: {e}")
-            import traceback
-            print(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error calling Gemini API: %s: %s", type(e).__name__, e)
             
             # Publish error event
             await self._publish_error_event(
@@ -4,16 +4,42 @@ Eye Module implementation for ChimeraForge.
 This module provides vision processing capabilities using OpenCV for face detection.
 """
 
-import base64
+import asyncio
+import binascii
+import logging
+import multiprocessing
+import os
+import threading
+import time
 import cv2
 import numpy as np
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional, Union
 from backend.core.event_bus import Event, EventBus, EventType
 from backend.core.module_registry import ModuleRegistry
+from backend.modules._score import face_confidence, warm_up as warm_up_scoring
 
+try:
+    from turbojpeg import TJPF_GRAY, TurboJPEG
+except ImportError:  # PyTurboJPEG is optional
+    TurboJPEG = None
 
-@dataclass
+try:
+    # SIMD base64 codec; accepts the same input and raises binascii.Error
+    # on the same malformed data as binascii.a2b_base64
+    from pybase64 import b64decode as _b64decode
+except ImportError:  # pybase64 is optional
+    _b64decode = binascii.a2b_base64
+
+
+logger = logging.getLogger(__name__)
+
+# Bound once; called for every published vision event
+_monotonic = time.monotonic
+
+
+@dataclass(slots=True, frozen=True)
 class BoundingBox:
     """
     Represents a bounding box for detected objects.
@@ -30,7 +56,7 @@ class BoundingBox:
     height: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FaceDetection:
     """
     Result of face detection processing.
@@ -45,6 +71,542 @@ class FaceDetection:
     bounding_box: Optional[BoundingBox] = None
 
 
+# Shared "no face" result (frozen), reused by every empty frame
+_NO_FACE = FaceDetection(detected=False)
+
+
+# Frames wider than this are downscaled before face detection
+DETECTION_WIDTH = 320
+
+# Threads in the default detection pool of an EyeModule
+DETECTION_THREADS = 2
+
+# Smallest face the Haar cascade looks for, in detection-size pixels
+HAAR_MIN_SIZE = (24, 24)
+
+# Most frames combined into one Haar mosaic (see detect_faces_in_batch)
+MAX_BATCH_SIZE = 8
+
+# Optional int8 YuNet face detection model; used instead of the Haar cascade
+# when present (override the location with EYE_YUNET_MODEL)
+DEFAULT_YUNET_MODEL = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "models",
+    "face_detection_yunet_2023mar_int8.onnx"
+)
+YUNET_SCORE_THRESHOLD = 0.6
+
+# Optional LBP face cascade, selected with EYE_DETECTOR=lbp (override the
+# location with EYE_LBP_CASCADE). LBP features are integer comparisons, so
+# it runs ~2-3x faster than Haar on CPUs without a GPU or DNN path, such as
+# ARM boards. OpenCV's pip wheels don't bundle it; copy
+# lbpcascade_frontalface_improved.xml from OpenCV's data/lbpcascades.
+DEFAULT_LBP_CASCADE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "models",
+    "lbpcascade_frontalface_improved.xml"
+)
+
+# Values accepted by EYE_DETECTOR; "auto" uses YuNet when its model is
+# present and the Haar cascade otherwise
+DETECTORS = ("auto", "haar", "lbp", "yunet")
+
+
+def configure_opencv(num_threads: int) -> None:
+    """
+    Enable OpenCV's optimized (SIMD/IPP, OpenCL) code paths and size its thread pool.
+    
+    Logs a warning if the installed OpenCV build lacks IPP or a parallel
+    framework, since detection then runs on slower generic kernels.
+    
+    Args:
+        num_threads: Threads OpenCV may use inside a single call
+    """
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(num_threads)
+    # Offload the cascade scan to an OpenCL device (e.g. an integrated GPU)
+    # when one is present
+    cv2.ocl.setUseOpenCL(cv2.ocl.haveOpenCL())
+    
+    build_info = cv2.getBuildInformation()
+    has_ipp = any(
+        line.strip().startswith("Intel IPP:") and "NO" not in line
+        for line in build_info.splitlines()
+    )
+    has_parallel = any(
+        line.strip().startswith("Parallel framework:") and "none" not in line.lower()
+        for line in build_info.splitlines()
+    )
+    if not (has_ipp and has_parallel):
+        logger.warning(
+            "OpenCV build lacks %s; face detection will be slower. Consider an "
+            "OpenCV build with -D WITH_IPP=ON -D WITH_TBB=ON",
+            "IPP" if not has_ipp else "a parallel framework"
+        )
+
+
+class _CudaCascade:
+    """
+    Haar cascade running on an NVIDIA GPU via OpenCV's CUDA module.
+    
+    Mirrors the detectMultiScale call used on cv2.CascadeClassifier, so it
+    can stand in for the CPU cascade. Only the frame is uploaded and only
+    the small array of detections is downloaded.
+    """
+    
+    def __init__(self, path: str):
+        self._cascade = cv2.cuda.CascadeClassifier_create(path)
+        self._frame = cv2.cuda_GpuMat()
+    
+    def detectMultiScale(self, gray, scaleFactor: float, minNeighbors: int, minSize: tuple):
+        self._cascade.setScaleFactor(scaleFactor)
+        self._cascade.setMinNeighbors(minNeighbors)
+        self._cascade.setMinObjectSize(minSize)
+        self._frame.upload(gray)
+        objects = self._cascade.detectMultiScale(self._frame)
+        return self._cascade.convert(objects)
+
+
+def _detector_setting() -> str:
+    """Return the face detector selected with EYE_DETECTOR (see DETECTORS)."""
+    detector = os.getenv("EYE_DETECTOR", "auto").lower()
+    if detector not in DETECTORS:
+        logger.warning("Unknown EYE_DETECTOR %r, using auto", detector)
+        return "auto"
+    return detector
+
+
+def _cascade_path() -> str:
+    """Return the cascade file to load: LBP if selected and present, else Haar."""
+    if _detector_setting() == "lbp":
+        path = os.getenv("EYE_LBP_CASCADE", DEFAULT_LBP_CASCADE)
+        if os.path.isfile(path):
+            return path
+        logger.warning("LBP cascade %s not found, using Haar cascade", path)
+    return cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+
+
+def _load_face_cascade():
+    """
+    Load the frontal face cascade (Haar, or LBP when selected).
+    
+    Uses the CUDA cascade when OpenCV was built with CUDA and a GPU is
+    present (override its cascade file with EYE_CUDA_CASCADE), and the
+    CPU cascade otherwise.
+    """
+    path = _cascade_path()
+    if hasattr(cv2.cuda, "CascadeClassifier_create"):
+        try:
+            if cv2.cuda.getCudaEnabledDeviceCount() > 0:
+                return _CudaCascade(os.getenv("EYE_CUDA_CASCADE", path))
+        except cv2.error as e:
+            logger.warning("Could not load CUDA face cascade, using CPU: %s", e)
+    return cv2.CascadeClassifier(path)
+
+
+def _yunet_model_path() -> Optional[str]:
+    """Return the configured YuNet model path if YuNet is selected and the file exists."""
+    if _detector_setting() not in ("auto", "yunet"):
+        return None
+    path = os.getenv("EYE_YUNET_MODEL", DEFAULT_YUNET_MODEL)
+    return path if path and os.path.isfile(path) else None
+
+
+def _load_yunet(model_path: Optional[str]):
+    """
+    Create a YuNet face detector, or return None to fall back to Haar.
+    
+    Args:
+        model_path: Path to the YuNet ONNX model, if available
+    
+    Returns:
+        cv2.FaceDetectorYN instance, or None if unavailable
+    """
+    if model_path is None or not hasattr(cv2, "FaceDetectorYN"):
+        return None
+    try:
+        return cv2.FaceDetectorYN.create(
+            model_path, "", (DETECTION_WIDTH, DETECTION_WIDTH),
+            score_threshold=YUNET_SCORE_THRESHOLD
+        )
+    except cv2.error as e:
+        logger.warning("Could not load YuNet model %s, using Haar cascade: %s", model_path, e)
+        return None
+
+
+# Per-thread scratch arrays reused for intermediate images between frames
+_scratch = threading.local()
+
+
+def _scratch_buffer(name: str, shape: tuple) -> np.ndarray:
+    """
+    Return a reusable uint8 array of the given shape for the current thread.
+    
+    Webcam streams have a fixed frame size, so after the first frame the
+    resize and grayscale outputs are written into the same memory instead
+    of allocating new multi-megabyte arrays on every call.
+    """
+    buf = getattr(_scratch, name, None)
+    if buf is None or buf.shape != shape:
+        buf = np.empty(shape, dtype=np.uint8)
+        setattr(_scratch, name, buf)
+    return buf
+
+
+def _downscale(image: np.ndarray):
+    """
+    Shrink frames wider than DETECTION_WIDTH.
+    
+    Presence detection doesn't need full webcam resolution, and detection
+    cost grows with pixel count.
+    
+    Returns:
+        Tuple of (possibly resized image, scale factor applied)
+    """
+    height, width = image.shape[:2]
+    if width <= DETECTION_WIDTH:
+        return image, 1.0
+    scale = DETECTION_WIDTH / width
+    target_height = max(1, int(height * scale))
+    resized = cv2.resize(
+        image,
+        (DETECTION_WIDTH, target_height),
+        dst=_scratch_buffer("resized", (target_height, DETECTION_WIDTH) + image.shape[2:]),
+        interpolation=cv2.INTER_AREA
+    )
+    return resized, scale
+
+
+def _detect_haar(cascade: cv2.CascadeClassifier, gray: np.ndarray):
+    """
+    Run the Haar cascade over a grayscale image, returning (x, y, w, h) rows.
+    
+    When OpenCL is available the scan runs through OpenCV's transparent
+    API on the GPU, falling back to the CPU if that fails.
+    """
+    if cv2.ocl.useOpenCL() and isinstance(cascade, cv2.CascadeClassifier):
+        try:
+            return cascade.detectMultiScale(
+                cv2.UMat(gray),
+                scaleFactor=1.1,
+                minNeighbors=5,
+                minSize=HAAR_MIN_SIZE
+            )
+        except cv2.error as e:
+            logger.warning("OpenCL face detection failed, using CPU: %s", e)
+            cv2.ocl.setUseOpenCL(False)
+    return cascade.detectMultiScale(
+        gray,
+        scaleFactor=1.1,
+        minNeighbors=5,
+        minSize=HAAR_MIN_SIZE
+    )
+
+
+def _find_face(cascade: cv2.CascadeClassifier, image: np.ndarray) -> FaceDetection:
+    """
+    Detect the first face in an image with the given cascade.
+    
+    Args:
+        cascade: Loaded Haar cascade
+        image: Grayscale image, or BGR image (converted to grayscale here)
+    
+    Returns:
+        FaceDetection result with bounding box if face found
+    """
+    # Downscale large frames first
+    height, width = image.shape[:2]
+    image, scale = _downscale(image)
+    
+    # Convert to grayscale for face detection, unless decoded as grayscale
+    if image.ndim == 2:
+        gray = image
+    else:
+        gray = cv2.cvtColor(
+            image, cv2.COLOR_BGR2GRAY,
+            dst=_scratch_buffer("gray", image.shape[:2])
+        )
+    
+    # Detect faces
+    faces = _detect_haar(cascade, gray)
+    
+    # Process detection results
+    if len(faces) > 0:
+        # Take the first detected face, mapped back to full-frame coordinates
+        x, y, w, h = (v / scale for v in faces[0])
+        
+        # Calculate confidence based on face size relative to image
+        confidence = float(face_confidence(w, h, height, width))
+        
+        return FaceDetection(
+            detected=True,
+            confidence=confidence,
+            bounding_box=BoundingBox(x=int(x), y=int(y), width=int(w), height=int(h))
+        )
+    else:
+        # No face detected
+        return _NO_FACE
+
+
+def _find_face_yunet(detector, image: np.ndarray) -> FaceDetection:
+    """
+    Detect the most confident face in a BGR image with YuNet.
+    
+    Args:
+        detector: cv2.FaceDetectorYN instance
+        image: Image as numpy array (BGR format from OpenCV)
+    
+    Returns:
+        FaceDetection result using the model's own score as confidence
+    """
+    image, scale = _downscale(image)
+    detector.setInputSize((image.shape[1], image.shape[0]))
+    _, faces = detector.detect(image)
+    
+    if faces is None or len(faces) == 0:
+        return _NO_FACE
+    
+    # Each row is x, y, w, h, five landmark points, score
+    best = faces[int(np.argmax(faces[:, -1]))]
+    x, y, w, h = (max(0.0, float(v)) / scale for v in best[:4])
+    return FaceDetection(
+        detected=True,
+        confidence=float(min(1.0, best[-1])),
+        bounding_box=BoundingBox(x=int(x), y=int(y), width=int(w), height=int(h))
+    )
+
+
+# Detectors of a detection pool worker, loaded once per worker thread or
+# process (cascade and YuNet instances are not safe to share across threads)
+_worker = threading.local()
+
+
+def init_detection_worker(yunet_model_path: Optional[str] = None) -> None:
+    """Pool initializer that loads the face detectors once per worker."""
+    if multiprocessing.parent_process() is not None:
+        # Parallelism comes from the worker processes themselves
+        configure_opencv(1)
+    _worker.cascade = _load_face_cascade()
+    warm_up_scoring()
+    _worker.yunet = _load_yunet(yunet_model_path)
+    _worker.jpeg = _load_turbojpeg()
+
+
+def _load_turbojpeg():
+    """
+    Create a libjpeg-turbo decoder, or return None to decode with OpenCV.
+    
+    Returns:
+        TurboJPEG instance, or None if PyTurboJPEG or libturbojpeg is missing
+    """
+    if TurboJPEG is None:
+        return None
+    try:
+        return TurboJPEG()
+    except (OSError, RuntimeError) as e:
+        logger.warning("Could not load libturbojpeg, decoding with OpenCV: %s", e)
+        return None
+
+
+def _decode_gray(image_bytes: bytes):
+    """
+    Decode an encoded image to grayscale.
+    
+    JPEGs go through libjpeg-turbo when available, which also shrinks the
+    frame during decoding (DCT scaling) as far as it can while staying at
+    least DETECTION_WIDTH wide. Other formats, and JPEGs libjpeg-turbo
+    rejects, are decoded by OpenCV.
+    
+    Returns:
+        Tuple of (grayscale image or None if undecodable, factor by which
+        the original frame is larger than the decoded one)
+    """
+    jpeg = _worker.jpeg
+    if jpeg is not None and image_bytes[:2] == b"\xff\xd8":
+        try:
+            width = jpeg.decode_header(image_bytes)[0]
+            denom = next(
+                (d for d in (8, 4, 2)
+                 if width // d >= DETECTION_WIDTH and (1, d) in jpeg.scaling_factors),
+                1
+            )
+            image = jpeg.decode(
+                image_bytes,
+                pixel_format=TJPF_GRAY,
+                scaling_factor=(1, denom) if denom > 1 else None
+            )
+            return image.reshape(image.shape[:2]), width / image.shape[1]
+        except OSError:
+            pass
+    return cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_GRAYSCALE), 1.0
+
+
+def detect_face_in_bytes(image_bytes: bytes) -> Optional[FaceDetection]:
+    """
+    Decode an encoded image and detect a face in it.
+    
+    Runs inside a detection pool worker, so it only touches per-worker state.
+    
+    Args:
+        image_bytes: Encoded (JPEG/PNG) image data
+    
+    Returns:
+        FaceDetection result, or None if the image could not be decoded
+    """
+    if getattr(_worker, "cascade", None) is None:
+        init_detection_worker(_yunet_model_path())
+    cascade = _worker.cascade
+    yunet = _worker.yunet
+    
+    if yunet is not None:
+        # YuNet takes BGR input
+        image = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_COLOR)
+        if image is None:
+            return None
+        return _find_face_yunet(yunet, image)
+    
+    # The cascade only needs luminance, so decode straight to grayscale
+    image, factor = _decode_gray(image_bytes)
+    if image is None:
+        return None
+    detection = _find_face(cascade, image)
+    if factor == 1.0 or not detection.detected:
+        return detection
+    # Map the box from the reduced decode back to the full frame
+    bb = detection.bounding_box
+    return FaceDetection(
+        detected=True,
+        confidence=detection.confidence,
+        bounding_box=BoundingBox(
+            x=int(bb.x * factor), y=int(bb.y * factor),
+            width=int(bb.width * factor), height=int(bb.height * factor)
+        )
+    )
+
+
+def detect_face_in_array(image: np.ndarray) -> FaceDetection:
+    """
+    Detect a face in an already decoded frame.
+    
+    Runs inside a detection pool worker, so it only touches per-worker state.
+    
+    Args:
+        image: Frame as a BGR or grayscale numpy array
+    
+    Returns:
+        FaceDetection result
+    """
+    if getattr(_worker, "cascade", None) is None:
+        init_detection_worker(_yunet_model_path())
+    
+    if _worker.yunet is not None:
+        # YuNet takes BGR input
+        if image.ndim == 2:
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        return _find_face_yunet(_worker.yunet, image)
+    return _find_face(_worker.cascade, image)
+
+
+def detect_faces_in_batch(frames: List[bytes]) -> List[Optional[FaceDetection]]:
+    """
+    Decode several encoded images and detect a face in each with one Haar pass.
+    
+    The downscaled grayscale frames are tiled side by side into a single
+    mosaic, separated by blank columns, and the cascade runs once over the
+    whole mosaic. This spreads the per-call setup of detectMultiScale across
+    the batch. The gap only keeps the smallest windows apart; larger windows
+    can straddle two tiles, so detections that don't lie entirely within
+    one tile are dropped. With YuNet loaded, frames are detected one by one.
+    
+    Args:
+        frames: Encoded (JPEG/PNG) images
+    
+    Returns:
+        FaceDetection result per frame, or None for frames that could not
+        be decoded
+    """
+    if getattr(_worker, "cascade", None) is None:
+        init_detection_worker(_yunet_model_path())
+    if _worker.yunet is not None or len(frames) == 1:
+        return [detect_face_in_bytes(frame) for frame in frames]
+    
+    results: List[Optional[FaceDetection]] = [None] * len(frames)
+    
+    # Downscale each decodable frame, copying it out of the scratch buffer
+    tiles = []
+    for index, frame in enumerate(frames):
+        image, factor = _decode_gray(frame)
+        if image is None:
+            continue
+        # Full-frame size, for scoring faces against the original frame
+        height, width = image.shape[0] * factor, image.shape[1] * factor
+        small, scale = _downscale(image)
+        # Scale from the full frame down to the tile
+        scale /= factor
+        tiles.append((index, small.copy() if small is not image else image, scale, height, width))
+    if not tiles:
+        return results
+    
+    # Lay the tiles out left to right with a gap of HAAR_MIN_SIZE columns
+    gap = HAAR_MIN_SIZE[0]
+    mosaic_height = max(tile.shape[0] for _, tile, _, _, _ in tiles)
+    mosaic_width = sum(tile.shape[1] for _, tile, _, _, _ in tiles) + gap * (len(tiles) - 1)
+    mosaic = np.zeros((mosaic_height, mosaic_width), dtype=np.uint8)
+    offsets = []
+    x0 = 0
+    for _, tile, _, _, _ in tiles:
+        tile_height, tile_width = tile.shape
+        mosaic[:tile_height, x0:x0 + tile_width] = tile
+        offsets.append(x0)
+        x0 += tile_width + gap
+    
+    # Assign each face to the tile containing it, keeping the first face per
+    # tile as _find_face does. Faces crossing a tile edge (into the gap, a
+    # neighbouring tile, or the padding below a shorter tile) are dropped.
+    faces_by_tile = {}
+    for x, y, w, h in _detect_haar(_worker.cascade, mosaic):
+        for position, (_, tile, _, _, _) in enumerate(tiles):
+            start = offsets[position]
+            tile_height, tile_width = tile.shape
+            if start <= x and x + w <= start + tile_width and y + h <= tile_height:
+                faces_by_tile.setdefault(position, (x - start, y, w, h))
+                break
+    
+    for position, (index, _, scale, height, width) in enumerate(tiles):
+        face = faces_by_tile.get(position)
+        if face is None:
+            results[index] = _NO_FACE
+            continue
+        x, y, w, h = (v / scale for v in face)
+        results[index] = FaceDetection(
+            detected=True,
+            confidence=float(face_confidence(w, h, height, width)),
+            bounding_box=BoundingBox(x=int(x), y=int(y), width=int(w), height=int(h))
+        )
+    return results
+
+
+def create_detection_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Create a process pool for running face detection off the event loop.
+    
+    Workers are spawned rather than forked, since forking a process that
+    already runs OpenCV and event bus threads can deadlock the child.
+    
+    Args:
+        max_workers: Number of worker processes
+    
+    Returns:
+        ProcessPoolExecutor whose workers have the face detectors preloaded
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_detection_worker,
+        initargs=(_yunet_model_path(),)
+    )
+
+
 class EyeModule:
     """
     Vision module that detects faces from webcam input using OpenCV.
@@ -53,31 +615,88 @@ class EyeModule:
     VISION_EVENT events when faces are detected or not detected.
     """
     
-    def __init__(self, event_bus: EventBus, registry: ModuleRegistry):
+    def __init__(self, event_bus: EventBus, registry: ModuleRegistry,
+                 executor: Optional[Executor] = None):
         """
         Initialize the Eye module.
         
         Args:
             event_bus: Event bus for publishing vision events
             registry: Module registry to check enabled state
+            executor: Optional pool (see create_detection_pool) to run
+                decoding and detection in; a small thread pool is used
+                when omitted
         """
         self.event_bus = event_bus
         self.registry = registry
         self.module_id = "eye"
         
+        # Decoding and detection never run on the event loop. OpenCV releases
+        # the GIL while it works, so threads are enough to keep the loop
+        # responsive; a shared process pool can be passed in instead.
+        self._owns_executor = executor is None
+        self.executor = executor if executor is not None else ThreadPoolExecutor(
+            max_workers=DETECTION_THREADS,
+            thread_name_prefix="eye-detect"
+        )
+        
+        # Let OpenCV use its dispatched SIMD kernels and parallelize the
+        # cascade's scale pyramid across cores
+        configure_opencv(max(2, (os.cpu_count() or 1) // 2))
+        
         # Load OpenCV's pre-trained Haar Cascade for face detection
         # Using the frontal face default cascade
-        self.face_cascade = cv2.CascadeClassifier(
-            cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-        )
+        self.face_cascade = _load_face_cascade()
+        
+        # Prefer the int8 YuNet DNN detector when its model is available
+        self.face_detector = _load_yunet(_yunet_model_path())
+        
+        # Compile the scoring functions up front rather than on the first frame
+        warm_up_scoring()
         
         # Subscribe to module state changes
         self.event_bus.subscribe(self.module_id, self._on_event)
         
         # State tracking for event filtering
         self.last_detection_state = False
-        self.last_publish_time = 0
+        # Monotonic clock reading of the last publish (-inf: never published)
+        self.last_publish_time = float("-inf")
         self.min_publish_interval = 5.0  # Minimum 5 seconds between redundant events
+        
+        # Last frame and its detection, for skipping re-sent identical frames
+        self._last_frame_bytes: Optional[bytes] = None
+        self._last_frame_detection: Optional[FaceDetection] = None
+        
+        # Frames waiting for a free pool slot, and batches currently running.
+        # Frames are only queued while every slot is busy, so an idle module
+        # detects each frame immediately and a busy one batches the backlog.
+        self._pending_frames: List[tuple] = []
+        self._batches_in_flight = 0
+        self._max_batches_in_flight = getattr(self.executor, "_max_workers", DETECTION_THREADS)
+        self._batch_tasks: set = set()
+        
+        # Last published face payload and its quantized detection key
+        self._last_payload: Optional[dict] = None
+        self._last_payload_key: Optional[tuple] = None
+    
+    def shutdown(self) -> None:
+        """Release the default detection pool (a passed-in pool is left alone)."""
+        if self._owns_executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+    
+    def reset_state(self) -> None:
+        """
+        Forget previously seen frames and published detections.
+        
+        Leaves the module as it was after construction without reloading
+        the detectors or recreating the detection pool.
+        """
+        self.last_detection_state = False
+        self.last_publish_time = float("-inf")
+        self._last_frame_bytes = None
+        self._last_frame_detection = None
+        self._last_payload = None
+        self._last_payload_key = None
     
     async def _on_event(self, event: Event) -> None:
         """
@@ -94,127 +713,233 @@ class EyeModule:
                 # Could perform initialization/cleanup based on state change
                 pass
     
-    async def process_frame(self, frame_base64: str) -> None:
+    async def process_frame(self, frame_base64: Union[str, bytes]) -> None:
         """
         Process a webcam frame for face detection.
         
         Args:
-            frame_base64: Base64-encoded image data
+            frame_base64: Base64-encoded image data, optionally as a data URL,
+                as text or as ASCII bytes
         """
         # Check if module is enabled
         if not self.registry.is_enabled(self.module_id):
             return
         
-        # Wrap processing in try-catch for error handling
+        # Skip the data URL prefix, if present
+        is_bytes = isinstance(frame_base64, (bytes, bytearray))
+        start = frame_base64.find(b',' if is_bytes else ',') + 1
+        
+        # Reject payloads that can't be valid base64 (non-ASCII or a length
+        # that isn't a multiple of 4) up front, so malformed input in a tight
+        # loop doesn't pay for raising and catching a decode error each time
+        if (len(frame_base64) - start) % 4 or not frame_base64.isascii():
+            await self._publish_invalid_base64("Incorrect length or non-ASCII characters")
+            return
+        
         try:
-            # Remove data URL prefix if present
-            if ',' in frame_base64:
-                frame_base64 = frame_base64.split(',')[1]
-            
-            # Decode base64 to bytes
-            image_bytes = base64.b64decode(frame_base64)
+            # Skip the prefix. Bytes are sliced through a memoryview, without
+            # copying. Text is handed to the decoder as is (both decoders take
+            # ASCII str, so it isn't encoded to bytes first); only a data URL
+            # prefix costs a copy, when the payload is sliced out.
+            data = memoryview(frame_base64)[start:] if is_bytes else frame_base64[start:]
             
-            # Convert bytes to numpy array
-            nparr = np.frombuffer(image_bytes, np.uint8)
+            # Decode base64 to bytes. The result is kept as the cached last
+            # frame and may be shipped to a worker process, so it is a fresh
+            # immutable object rather than a view into a reused buffer.
+            image_bytes = _b64decode(data)
             
-            # Decode image
-            image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        except binascii.Error as e:
+            # Base64 decoding error
+            await self._publish_invalid_base64(str(e))
+            return
+        
+        except Exception as e:
+            # Catch-all for unexpected errors
+            await self._publish_error_event(
+                error_type="processing",
+                message=f"Unexpected error in Eye module: {str(e)}",
+                details={"error": str(e), "error_type": type(e).__name__},
+                recoverable=True
+            )
+            # Publish vision event indicating no detection for graceful degradation
+            detection = _NO_FACE
+            await self._publish_vision_event(detection)
+            return
+        
+        await self.process_frame_bytes(image_bytes)
+    
+    async def _publish_invalid_base64(self, error: str) -> None:
+        """
+        Report a frame whose base64 data could not be decoded.
+        
+        Args:
+            error: Description of what was wrong with the data
+        """
+        await self._publish_error_event(
+            error_type="validation",
+            message=f"Invalid base64 image data: {error}",
+            details={"error": error},
+            recoverable=True
+        )
+        # Publish vision event indicating no detection for graceful degradation
+        await self._publish_vision_event(_NO_FACE)
+    
+    async def process_frame_bytes(self, image_bytes: bytes) -> None:
+        """
+        Process an encoded (JPEG/PNG) webcam frame for face detection.
+        
+        Args:
+            image_bytes: Raw encoded image data
+        """
+        # Check if module is enabled
+        if not self.registry.is_enabled(self.module_id):
+            return
+        
+        # The UI re-sends the same frame while idle; reuse the previous result
+        # instead of decoding and scanning it again. The usual filtering in
+        # _publish_vision_event still decides whether anything is published.
+        if self._last_frame_detection is not None and image_bytes == self._last_frame_bytes:
+            await self._publish_vision_event(self._last_frame_detection)
+            return
+        
+        # Wrap processing in try-catch for error handling
+        try:
+            # Decode and detect in the pool, keeping the event loop free
+            detection = await self._detect(image_bytes)
             
-            if image is None:
+            if detection is None:
                 # Failed to decode image - publish error event
                 await self._publish_error_event(
                     error_type="processing",
-                    message="Failed to decode image from base64 data",
-                    details={"frame_length": len(frame_base64)},
+                    message="Failed to decode image data",
+                    details={"frame_length": len(image_bytes)},
                     recoverable=True
                 )
                 # Still publish vision event indicating no detection
-                detection = FaceDetection(detected=False)
+                detection = _NO_FACE
                 await self._publish_vision_event(detection)
                 return
             
-            # Perform face detection
-            detection = self.detect_face(image)
+            self._last_frame_bytes = image_bytes
+            self._last_frame_detection = detection
             
             # Publish vision event
             await self._publish_vision_event(detection)
             
-        except base64.binascii.Error as e:
-            # Base64 decoding error
-            await self._publish_error_event(
-                error_type="validation",
-                message=f"Invalid base64 image data: {str(e)}",
-                details={"error": str(e)},
-                recoverable=True
+        except Exception as e:
+            await self._publish_detection_failure(e)
+    
+    async def process_frame_array(self, image: np.ndarray) -> None:
+        """
+        Process an already decoded webcam frame for face detection.
+        
+        For callers that hold pixels rather than an encoded image, so no
+        encode/decode round trip is needed.
+        
+        Args:
+            image: Frame as a BGR or grayscale numpy array
+        """
+        # Check if module is enabled
+        if not self.registry.is_enabled(self.module_id):
+            return
+        
+        try:
+            # Detect in the pool, keeping the event loop free
+            detection = await asyncio.get_running_loop().run_in_executor(
+                self.executor, detect_face_in_array, image
             )
-            # Publish vision event indicating no detection for graceful degradation
-            detection = FaceDetection(detected=False)
-            await self._publish_vision_event(detection)
-            
-        except cv2.error as e:
+        except Exception as e:
+            await self._publish_detection_failure(e)
+            return
+        
+        await self._publish_vision_event(detection)
+    
+    async def _publish_detection_failure(self, error: Exception) -> None:
+        """
+        Report an error raised while detecting a face in a frame.
+        
+        Args:
+            error: The exception raised by decoding or detection
+        """
+        if isinstance(error, cv2.error):
             # OpenCV processing error
             await self._publish_error_event(
                 error_type="processing",
-                message=f"OpenCV processing error: {str(e)}",
-                details={"error": str(e)},
+                message=f"OpenCV processing error: {str(error)}",
+                details={"error": str(error)},
                 recoverable=True
             )
-            # Publish vision event indicating no detection for graceful degradation
-            detection = FaceDetection(detected=False)
-            await self._publish_vision_event(detection)
-            
-        except Exception as e:
+        else:
             # Catch-all for unexpected errors
             await self._publish_error_event(
                 error_type="processing",
-                message=f"Unexpected error in Eye module: {str(e)}",
-                details={"error": str(e), "error_type": type(e).__name__},
+                message=f"Unexpected error in Eye module: {str(error)}",
+                details={"error": str(error), "error_type": type(error).__name__},
                 recoverable=True
             )
-            # Publish vision event indicating no detection for graceful degradation
-            detection = FaceDetection(detected=False)
-            await self._publish_vision_event(detection)
+        # Publish vision event indicating no detection for graceful degradation
+        await self._publish_vision_event(_NO_FACE)
+    
+    async def _detect(self, image_bytes: bytes) -> Optional[FaceDetection]:
+        """
+        Queue a frame for detection and wait for its result.
+        
+        Returns:
+            FaceDetection result, or None if the image could not be decoded
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending_frames.append((image_bytes, future))
+        self._dispatch_frames()
+        return await future
+    
+    def _dispatch_frames(self) -> None:
+        """Start batches for pending frames while pool slots are free."""
+        while self._pending_frames and self._batches_in_flight < self._max_batches_in_flight:
+            batch = self._pending_frames[:MAX_BATCH_SIZE]
+            del self._pending_frames[:MAX_BATCH_SIZE]
+            self._batches_in_flight += 1
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _run_batch(self, batch: List[tuple]) -> None:
+        """Run detection for a batch of (image_bytes, future) in the pool."""
+        loop = asyncio.get_running_loop()
+        try:
+            if len(batch) == 1:
+                results = [await loop.run_in_executor(
+                    self.executor, detect_face_in_bytes, batch[0][0]
+                )]
+            else:
+                results = await loop.run_in_executor(
+                    self.executor, detect_faces_in_batch, [frame for frame, _ in batch]
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._batches_in_flight -= 1
+            self._dispatch_frames()
     
     def detect_face(self, image: np.ndarray) -> FaceDetection:
         """
         Detect faces in an image using OpenCV.
         
         Args:
-            image: Image as numpy array (BGR format from OpenCV)
+            image: Image as numpy array (BGR format from OpenCV; grayscale
+                is also accepted when the Haar cascade is in use)
             
         Returns:
             FaceDetection result with bounding box if face found
         """
-        # Convert to grayscale for face detection
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        
-        # Detect faces
-        faces = self.face_cascade.detectMultiScale(
-            gray,
-            scaleFactor=1.1,
-            minNeighbors=5,
-            minSize=(30, 30)
-        )
-        
-        # Process detection results
-        if len(faces) > 0:
-            # Take the first detected face
-            x, y, w, h = faces[0]
-            
-            # Calculate confidence based on face size relative to image
-            # Larger faces are generally more confident detections
-            image_area = image.shape[0] * image.shape[1]
-            face_area = w * h
-            confidence = min(1.0, (face_area / image_area) * 10)  # Scale factor
-            
-            return FaceDetection(
-                detected=True,
-                confidence=confidence,
-                bounding_box=BoundingBox(x=int(x), y=int(y), width=int(w), height=int(h))
-            )
-        else:
-            # No face detected
-            return FaceDetection(detected=False, confidence=0.0)
+        if self.face_detector is not None:
+            return _find_face_yunet(self.face_detector, image)
+        return _find_face(self.face_cascade, image)
     
     async def _publish_vision_event(self, detection: FaceDetection) -> None:
         """
@@ -223,25 +948,9 @@ class EyeModule:
         Args:
             detection: Face detection result to publish
         """
-        # Build payload
-        payload = {
-            "detected": detection.detected,
-            "object_type": "face" if detection.detected else None,
-            "confidence": detection.confidence
-        }
-        
-        # Add bounding box if face was detected
-        if detection.bounding_box:
-            payload["bounding_box"] = {
-                "x": detection.bounding_box.x,
-                "y": detection.bounding_box.y,
-                "width": detection.bounding_box.width,
-                "height": detection.bounding_box.height
-            }
-        
-        # Filter redundant events to prevent spamming
-        import time
-        current_time = time.time()
+        # Filter redundant events to prevent spamming; decided before the
+        # payload is built so skipped frames don't allocate anything
+        current_time = _monotonic()
         
         # Always publish if state changed (detected vs not detected)
         state_changed = detection.detected != self.last_detection_state
@@ -249,22 +958,59 @@ class EyeModule:
         # Always publish if enough time has passed since last event
         time_elapsed = (current_time - self.last_publish_time) > self.min_publish_interval
         
-        if state_changed or time_elapsed:
-            # Create and publish event
-            event = Event.create(
-                source_module=self.module_id,
-                type=EventType.VISION_EVENT,
-                payload=payload
+        if not (state_changed or time_elapsed):
+            # Skip publishing redundant event
+            return
+        
+        if not detection.detected:
+            # Each event gets its own dict, since subscribers may modify it
+            payload = {"detected": False, "object_type": None, "confidence": 0.0}
+        else:
+            # A face that stays put yields the same payload frame after frame;
+            # reuse the last one's contents when the detection matches it on
+            # an 8px grid
+            bb = detection.bounding_box
+            key = (
+                (bb.x >> 3, bb.y >> 3, bb.width >> 3, bb.height >> 3) if bb else None,
+                round(detection.confidence, 2)
             )
+            if key != self._last_payload_key:
+                # Build payload
+                cached = {
+                    "detected": True,
+                    "object_type": "face",
+                    "confidence": detection.confidence
+                }
+                
+                # Add bounding box of the detected face
+                if bb:
+                    cached["bounding_box"] = {
+                        "x": bb.x,
+                        "y": bb.y,
+                        "width": bb.width,
+                        "height": bb.height
+                    }
+                
+                self._last_payload_key = key
+                self._last_payload = cached
             
-            await self.event_bus.publish(event)
-            
-            # Update state tracking
-            self.last_detection_state = detection.detected
-            self.last_publish_time = current_time
-        else:
-            # Skip publishing redundant event
-            pass
+            # Each event gets its own copy, since subscribers may modify it
+            payload = dict(self._last_payload)
+            if "bounding_box" in payload:
+                payload["bounding_box"] = dict(payload["bounding_box"])
+        
+        # Create and publish event
+        event = Event.create(
+            source_module=self.module_id,
+            type=EventType.VISION_EVENT,
+            payload=payload
+        )
+        
+        await self.event_bus.publish(event)
+        
+        # Update state tracking
+        self.last_detection_state = detection.detected
+        self.last_publish_time = current_time
     
     async def _publish_error_event(self, error_type: str, message: str, 
                                    details: dict, recoverable: bool = True) -> None:
@@ -0,0 +1,85 @@
+"""
+Shared pytest configuration for the ChimeraForge test suite.
+
+Hypothesis profiles: by default Hypothesis' own settings are used, so
+property tests keep exploring new inputs (the event-bus properties set a
+smaller example count themselves). Set HYPOTHESIS_PROFILE=fast for a
+reduced, derandomized set of examples, or HYPOTHESIS_PROFILE=ci to replay
+the examples saved in .hypothesis/ by earlier runs (cache that directory
+between CI runs). The fast and ci profiles don't shrink failing examples
+(shrinking the large event-bus properties can take minutes); pass
+--hypothesis-shrink to turn it back on.
+
+Tests marked slow or perf are skipped unless selected with -m slow or -m perf.
+
+pytest.ini runs the suite in parallel with pytest-xdist (-n auto --dist
+loadfile), so pytest-xdist must be installed. Pass -n0 to run serially, e.g.
+to debug a single test; -p no:xdist does not work, since -n would then be an
+unknown option.
+
+Async tests run on uvloop where it is installed (it ships with
+uvicorn[standard], except on Windows), matching how the app is served.
+"""
+
+import asyncio
+import os
+
+import pytest
+from hypothesis import Phase, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+
+# Every phase except shrinking
+_NO_SHRINK = (Phase.explicit, Phase.reuse, Phase.generate)
+
+# derandomize cannot be combined with an example database
+settings.register_profile(
+    "fast",
+    max_examples=25,
+    derandomize=True,
+    database=None,
+    phases=_NO_SHRINK
+)
+settings.register_profile(
+    "ci",
+    max_examples=25,
+    database=DirectoryBasedExampleDatabase(".hypothesis/examples"),
+    phases=_NO_SHRINK
+)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
+if uvloop is not None and os.name != "nt":
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--hypothesis-shrink",
+        action="store_true",
+        help="shrink failing Hypothesis examples (off in the fast and ci profiles)"
+    )
+
+
+def pytest_configure(config):
+    """Re-enable shrinking on top of the loaded profile when asked to."""
+    if config.getoption("--hypothesis-shrink"):
+        settings.register_profile("shrink", parent=settings.default, phases=tuple(Phase))
+        settings.load_profile("shrink")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow or perf unless the run selects them with -m."""
+    markexpr = config.getoption("markexpr")
+    for marker in ("slow", "perf"):
+        if marker in markexpr:
+            continue
+        skip = pytest.mark.skip(reason=f"need -m {marker} option to run")
+        for item in items:
+            if marker in item.keywords:
+                item.add_marker(skip)
+
@@ -0,0 +1,113 @@
+"""
+Shared fixtures for the integration tests.
+"""
+
+from collections import Counter
+from types import SimpleNamespace
+from typing import Callable, NamedTuple, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.core.event_bus import Event, EventBus
+from backend.core.module_registry import ModuleRegistry
+from backend.modules.brain import BrainModule
+from backend.modules.eye import EyeModule
+
+
+# No workflow publishes more than a handful of events
+TEST_LOG_SIZE = 32
+
+
+@pytest.fixture
+def event_bus():
+    """Create an event bus for testing."""
+    return EventBus(max_log_size=TEST_LOG_SIZE)
+
+
+@pytest.fixture
+def module_registry():
+    """Create a module registry for testing."""
+    return ModuleRegistry()
+
+
+class EventCounter:
+    """
+    Count published events by type as they are delivered.
+    
+    Lets tests assert on how many events of a type were published without
+    scanning the event log.
+    
+    Attributes:
+        counts: Number of events seen per event type
+    """
+    
+    def __init__(self, event_bus: EventBus):
+        self.counts: Counter = Counter()
+        event_bus.subscribe("event_counter", self._on_event)
+    
+    async def _on_event(self, event: Event) -> None:
+        self.counts[event.type] += 1
+
+
+@pytest.fixture
+def event_counter(event_bus):
+    """Create an event counter subscribed to the test event bus."""
+    return EventCounter(event_bus)
+
+
+@pytest.fixture
+def eye_module(event_bus, module_registry):
+    """Create an Eye module for testing."""
+    module = EyeModule(event_bus, module_registry)
+    yield module
+    module.shutdown()
+
+
+@pytest.fixture
+def brain_module_factory(event_bus, module_registry) -> Callable[..., BrainModule]:
+    """
+    Provide a factory for Brain modules with a mocked LLM client.
+    
+    The factory takes the response content the client returns, or an
+    exception it raises; the mock is available as `brain_module.client`.
+    """
+    def factory(content: Optional[str] = None, error: Optional[Exception] = None) -> BrainModule:
+        mock_client = AsyncMock()
+        if error is not None:
+            mock_client.chat.completions.create = AsyncMock(side_effect=error)
+        elif content is not None:
+            # Plain namespaces are enough; nothing asserts on the response
+            response = SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+            )
+            mock_client.chat.completions.create = AsyncMock(return_value=response)
+        
+        brain_module = BrainModule(event_bus, module_registry, api_key="test_key")
+        brain_module.client = mock_client
+        return brain_module
+    
+    return factory
+
+
+class Workflow(NamedTuple):
+    """Modules wired to one event bus for an enable/disable scenario."""
+    event_bus: EventBus
+    module_registry: ModuleRegistry
+    eye_module: EyeModule
+    brain_module: BrainModule
+    event_counter: EventCounter
+
+
+@pytest.fixture
+def workflow(request, event_bus, module_registry, eye_module, brain_module_factory, event_counter):
+    """
+    Create Eye and Brain modules with the requested modules enabled.
+    
+    Parametrize indirectly with a tuple of module IDs to enable; by default
+    every module starts disabled.
+    """
+    brain_module = brain_module_factory('{"text": "I see you!", "speak": "Hello!"}')
+    for module_id in getattr(request, "param", ()):
+        module_registry.toggle_module(module_id)
+    return Workflow(event_bus, module_registry, eye_module, brain_module, event_counter)
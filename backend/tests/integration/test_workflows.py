@@ -10,22 +10,19 @@ These tests verify end-to-end functionality across multiple modules:
 import pytest
 import asyncio
 import base64
+import time
 import cv2
 import numpy as np
-from unittest.mock import AsyncMock, MagicMock, patch
 from backend.core.event_bus import Event, EventBus, EventType
-from backend.core.module_registry import ModuleRegistry
-from backend.modules.eye import EyeModule
-from backend.modules.brain import BrainModule
 
 
-def create_test_image_base64(with_face: bool = True) -> str:
+def _render_test_image_base64(with_face: bool) -> str:
     """
-    Create a test image with or without a face for testing.
+    Render a test image with or without a face.
     
     Args:
         with_face: Whether to include a face-like pattern
-        
+    
     Returns:
         Base64-encoded image string
     """
@@ -44,18 +41,57 @@ def create_test_image_base64(with_face: bool = True) -> str:
         # Create a blank image
         img = np.zeros((480, 640, 3), dtype=np.uint8)
     
-    # Encode to JPEG
-    _, buffer = cv2.imencode('.jpg', img)
+    # Encode to JPEG; flat synthetic shapes don't need high quality
+    _, buffer = cv2.imencode('.jpg', img, [int(cv2.IMWRITE_JPEG_QUALITY), 50])
     # Convert to base64
-    img_base64 = base64.b64encode(buffer).decode('utf-8')
+    img_base64 = base64.b64encode(buffer).decode('ascii')
     return img_base64
 
 
+# Only two distinct test images exist; render them once at import
+_FRAME_FACE = _render_test_image_base64(with_face=True)
+_FRAME_NO_FACE = _render_test_image_base64(with_face=False)
+
+
+def create_test_image_base64(with_face: bool = True) -> str:
+    """
+    Get a test image with or without a face for testing.
+    
+    Args:
+        with_face: Whether to include a face-like pattern
+    
+    Returns:
+        Base64-encoded image string
+    """
+    return _FRAME_FACE if with_face else _FRAME_NO_FACE
+
+
+async def wait_for_event(event_bus: EventBus, event_type: str,
+                         timeout: float = 1.0, count: int = 1) -> None:
+    """
+    Wait until the event log holds at least `count` events of a type.
+    
+    Returns as soon as the events are published instead of sleeping for a
+    fixed time, and fails the test if they don't appear within the timeout.
+    
+    Args:
+        event_bus: Event bus to watch
+        event_type: Event type to wait for
+        timeout: Maximum time to wait in seconds
+        count: Number of events of that type to wait for
+    """
+    async def _wait() -> None:
+        while sum(1 for _ in event_bus.iter_events_by_type(event_type)) < count:
+            await event_bus.wait_for_events(event_bus.last_seq)
+    
+    await asyncio.wait_for(_wait(), timeout=timeout)
+
+
 class TestVisionPipeline:
     """Integration tests for the vision pipeline workflow."""
     
     @pytest.mark.asyncio
-    async def test_full_vision_pipeline_with_face_detection(self):
+    async def test_full_vision_pipeline_with_face_detection(self, event_bus, module_registry, eye_module, brain_module_factory):
         """
         Test the complete vision pipeline: frame → detection → reasoning → action.
         
@@ -66,21 +102,8 @@ class TestVisionPipeline:
         4. Verify Brain receives event and publishes SYSTEM_ACTION
         5. Verify events are in correct order
         """
-        # Initialize components
-        event_bus = EventBus(max_log_size=1000)
-        module_registry = ModuleRegistry()
-        eye_module = EyeModule(event_bus, module_registry)
-        
-        # Mock OpenAI client for Brain module
-        mock_openai_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '{"text": "Greetings, human!", "speak": "Hello there!"}'
-        mock_openai_client.chat.completions.create = AsyncMock(return_value=mock_response)
-        
-        # Initialize Brain module with mocked client
-        brain_module = BrainModule(event_bus, module_registry, api_key="test_key")
-        brain_module.client = mock_openai_client
+        # Brain module with a mocked LLM client
+        brain_module = brain_module_factory('{"text": "Greetings, human!", "speak": "Hello there!"}')
         
         # Enable both modules
         module_registry.toggle_module("eye")
@@ -96,17 +119,17 @@ class TestVisionPipeline:
         await eye_module.process_frame(test_frame)
         
         # Wait for Brain module to process
-        await asyncio.sleep(0.2)
+        await wait_for_event(event_bus, EventType.SYSTEM_ACTION)
         
         # Verify events were published
-        all_events = event_bus.get_all_events()
+        event_count = sum(1 for _ in event_bus.iter_events())
         
         # Should have at least 2 events: VISION_EVENT, SYSTEM_ACTION
         # (MODULE_STATE_CHANGED events are only published via API, not direct registry calls)
-        assert len(all_events) >= 2, f"Expected at least 2 events, got {len(all_events)}"
+        assert event_count >= 2, f"Expected at least 2 events, got {event_count}"
         
         # Find VISION_EVENT
-        vision_events = [e for e in all_events if e.type == EventType.VISION_EVENT]
+        vision_events = event_bus.get_events_by_type(EventType.VISION_EVENT)
         assert len(vision_events) >= 1, "Should have at least one VISION_EVENT"
         
         vision_event = vision_events[0]
@@ -114,7 +137,7 @@ class TestVisionPipeline:
         assert "detected" in vision_event.payload
         
         # Find SYSTEM_ACTION event
-        action_events = [e for e in all_events if e.type == EventType.SYSTEM_ACTION]
+        action_events = event_bus.get_events_by_type(EventType.SYSTEM_ACTION)
         assert len(action_events) >= 1, "Should have at least one SYSTEM_ACTION event"
         
         action_event = action_events[0]
@@ -122,15 +145,13 @@ class TestVisionPipeline:
         assert "text" in action_event.payload
         
         # Verify event ordering: VISION_EVENT should come before SYSTEM_ACTION
-        vision_index = all_events.index(vision_event)
-        action_index = all_events.index(action_event)
-        assert vision_index < action_index, "VISION_EVENT should come before SYSTEM_ACTION"
+        assert vision_event.seq < action_event.seq, "VISION_EVENT should come before SYSTEM_ACTION"
         
         # Verify Brain was called with correct context
-        mock_openai_client.chat.completions.create.assert_called_once()
+        brain_module.client.chat.completions.create.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_vision_pipeline_without_face(self):
+    async def test_vision_pipeline_without_face(self, event_bus, module_registry, eye_module, brain_module_factory):
         """
         Test vision pipeline when no face is detected.
         
@@ -140,20 +161,8 @@ class TestVisionPipeline:
         3. Verify Eye publishes VISION_EVENT with detected=False
         4. Verify Brain still processes and responds
         """
-        # Initialize components
-        event_bus = EventBus(max_log_size=1000)
-        module_registry = ModuleRegistry()
-        eye_module = EyeModule(event_bus, module_registry)
-        
-        # Mock OpenAI client
-        mock_openai_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '{"text": "The darkness is empty...", "speak": null}'
-        mock_openai_client.chat.completions.create = AsyncMock(return_value=mock_response)
-        
-        brain_module = BrainModule(event_bus, module_registry, api_key="test_key")
-        brain_module.client = mock_openai_client
+        # Brain module with a mocked LLM client
+        brain_module = brain_module_factory('{"text": "The darkness is empty...", "speak": null}')
         
         # Enable modules
         module_registry.toggle_module("eye")
@@ -164,45 +173,38 @@ class TestVisionPipeline:
         
         # Process frame
         await eye_module.process_frame(test_frame)
-        await asyncio.sleep(0.2)
+        await wait_for_event(event_bus, EventType.SYSTEM_ACTION)
         
         # Verify events
-        all_events = event_bus.get_all_events()
-        
-        vision_events = [e for e in all_events if e.type == EventType.VISION_EVENT]
+        vision_events = event_bus.get_events_by_type(EventType.VISION_EVENT)
         assert len(vision_events) >= 1
         
         vision_event = vision_events[0]
         assert vision_event.payload["detected"] is False
         
         # Brain should still respond
-        action_events = [e for e in all_events if e.type == EventType.SYSTEM_ACTION]
+        action_events = event_bus.get_events_by_type(EventType.SYSTEM_ACTION)
         assert len(action_events) >= 1, "Brain should respond even when no face detected"
     
     @pytest.mark.asyncio
-    async def test_vision_pipeline_event_delivery_timing(self):
+    async def test_vision_pipeline_event_delivery_timing(self, event_bus, module_registry):
         """
         Test that events are delivered within required timing constraints.
         
         Property 6: Event delivery timing - events should be delivered within 100ms.
         """
-        import time
-        
-        # Initialize components
-        event_bus = EventBus(max_log_size=1000)
-        module_registry = ModuleRegistry()
-        
-        # Track when events are received
-        received_times = []
+        # Track when events are received (perf_counter_ns is monotonic, so
+        # clock adjustments can't skew the measurement)
+        received_ns = []
         
         async def timing_callback(event: Event):
-            received_times.append(time.time())
+            received_ns.append(time.perf_counter_ns())
         
         # Subscribe a test module
         event_bus.subscribe("test_module", timing_callback)
         
         # Publish an event and record time
-        publish_time = time.time()
+        publish_ns = time.perf_counter_ns()
         event = Event.create(
             source_module="test",
             type="TEST_EVENT",
@@ -210,63 +212,41 @@ class TestVisionPipeline:
         )
         await event_bus.publish(event)
         
-        # Wait a bit for delivery
-        await asyncio.sleep(0.05)
+        # Publishing awaits delivery to subscribers, so nothing is still pending
         
         # Verify delivery timing
-        assert len(received_times) == 1, "Event should be delivered once"
-        delivery_time_ms = (received_times[0] - publish_time) * 1000
-        assert delivery_time_ms < 100, f"Event delivery took {delivery_time_ms:.2f}ms, should be < 100ms"
+        assert len(received_ns) == 1, "Event should be delivered once"
+        delivery_ns = received_ns[0] - publish_ns
+        assert delivery_ns < 100_000_000, f"Event delivery took {delivery_ns / 1e6:.2f}ms, should be < 100ms"
 
 
 class TestModuleEnableDisable:
     """Integration tests for module enable/disable affecting event processing."""
     
     @pytest.mark.asyncio
-    async def test_disabled_eye_module_ignores_frames(self):
+    async def test_disabled_eye_module_ignores_frames(self, workflow):
         """
         Test that disabled Eye module does not process frames.
         
         Property 3: Disabled modules ignore events.
         """
-        # Initialize components
-        event_bus = EventBus(max_log_size=1000)
-        module_registry = ModuleRegistry()
-        eye_module = EyeModule(event_bus, module_registry)
-        
-        # Eye module starts disabled
-        assert not module_registry.is_enabled("eye")
-        
-        # Create test frame
-        test_frame = create_test_image_base64(with_face=True)
+        assert not workflow.module_registry.is_enabled("eye")
         
         # Process frame while disabled
-        await eye_module.process_frame(test_frame)
-        await asyncio.sleep(0.1)
+        await workflow.eye_module.process_frame(create_test_image_base64(with_face=True))
+        # Publishing awaits delivery to subscribers, so nothing is still pending
         
         # Verify no VISION_EVENT was published
-        all_events = event_bus.get_all_events()
-        vision_events = [e for e in all_events if e.type == EventType.VISION_EVENT]
-        assert len(vision_events) == 0, "Disabled Eye module should not publish VISION_EVENT"
+        assert workflow.event_counter.counts[EventType.VISION_EVENT] == 0, "Disabled Eye module should not publish VISION_EVENT"
     
     @pytest.mark.asyncio
-    async def test_disabled_brain_module_ignores_vision_events(self):
+    async def test_disabled_brain_module_ignores_vision_events(self, workflow):
         """
         Test that disabled Brain module does not process VISION_EVENT.
         
         Property 3: Disabled modules ignore events.
         """
-        # Initialize components
-        event_bus = EventBus(max_log_size=1000)
-        module_registry = ModuleRegistry()
-        
-        # Mock OpenAI client
-        mock_openai_client = AsyncMock()
-        brain_module = BrainModule(event_bus, module_registry, api_key="test_key")
-        brain_module.client = mock_openai_client
-        
-        # Brain module starts disabled
-        assert not module_registry.is_enabled("brain")
+        assert not workflow.module_registry.is_enabled("brain")
         
         # Publish a VISION_EVENT
         vision_event = Event.create(
@@ -274,19 +254,17 @@ class TestModuleEnableDisable:
             type=EventType.VISION_EVENT,
             payload={"detected": True, "object_type": "face", "confidence": 0.9}
         )
-        await event_bus.publish(vision_event)
-        await asyncio.sleep(0.2)
+        await workflow.event_bus.publish(vision_event)
         
         # Verify Brain did not process the event
-        all_events = event_bus.get_all_events()
-        action_events = [e for e in all_events if e.type == EventType.SYSTEM_ACTION]
-        assert len(action_events) == 0, "Disabled Brain module should not publish SYSTEM_ACTION"
+        assert workflow.event_counter.counts[EventType.SYSTEM_ACTION] == 0, "Disabled Brain module should not publish SYSTEM_ACTION"
         
         # Verify OpenAI was not called
-        mock_openai_client.chat.completions.create.assert_not_called()
+        workflow.brain_module.client.chat.completions.create.assert_not_called()
     
     @pytest.mark.asyncio
-    async def test_enabling_module_mid_workflow(self):
+    @pytest.mark.parametrize("workflow", [("eye",)], indirect=True)
+    async def test_enabling_module_mid_workflow(self, workflow):
         """
         Test enabling a module during workflow execution.
         
@@ -296,38 +274,17 @@ class TestModuleEnableDisable:
         3. Enable Brain
         4. Process another frame (both modules process)
         """
-        # Initialize components
-        event_bus = EventBus(max_log_size=1000)
-        module_registry = ModuleRegistry()
-        eye_module = EyeModule(event_bus, module_registry)
-        
-        # Mock OpenAI client
-        mock_openai_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '{"text": "I see you now!", "speak": "Hello!"}'
-        mock_openai_client.chat.completions.create = AsyncMock(return_value=mock_response)
-        
-        brain_module = BrainModule(event_bus, module_registry, api_key="test_key")
-        brain_module.client = mock_openai_client
-        
-        # Enable only Eye
-        module_registry.toggle_module("eye")
-        assert module_registry.is_enabled("eye")
+        event_bus, module_registry, eye_module, _, event_counter = workflow
         assert not module_registry.is_enabled("brain")
         
         # Process first frame
         test_frame = create_test_image_base64(with_face=True)
         await eye_module.process_frame(test_frame)
-        await asyncio.sleep(0.1)
+        await wait_for_event(event_bus, EventType.VISION_EVENT)
         
         # Should have VISION_EVENT but no SYSTEM_ACTION
-        events_before = event_bus.get_all_events()
-        vision_events_before = [e for e in events_before if e.type == EventType.VISION_EVENT]
-        action_events_before = [e for e in events_before if e.type == EventType.SYSTEM_ACTION]
-        
-        assert len(vision_events_before) >= 1, "Eye should publish VISION_EVENT"
-        assert len(action_events_before) == 0, "Brain should not publish SYSTEM_ACTION when disabled"
+        assert event_counter.counts[EventType.VISION_EVENT] >= 1, "Eye should publish VISION_EVENT"
+        assert event_counter.counts[EventType.SYSTEM_ACTION] == 0, "Brain should not publish SYSTEM_ACTION when disabled"
         
         # Enable Brain
         module_registry.toggle_module("brain")
@@ -335,16 +292,14 @@ class TestModuleEnableDisable:
         
         # Process second frame
         await eye_module.process_frame(test_frame)
-        await asyncio.sleep(0.2)
+        await wait_for_event(event_bus, EventType.SYSTEM_ACTION)
         
         # Should now have SYSTEM_ACTION
-        events_after = event_bus.get_all_events()
-        action_events_after = [e for e in events_after if e.type == EventType.SYSTEM_ACTION]
-        
-        assert len(action_events_after) >= 1, "Brain should publish SYSTEM_ACTION after being enabled"
+        assert event_counter.counts[EventType.SYSTEM_ACTION] >= 1, "Brain should publish SYSTEM_ACTION after being enabled"
     
     @pytest.mark.asyncio
-    async def test_disabling_module_mid_workflow(self):
+    @pytest.mark.parametrize("workflow", [("eye", "brain")], indirect=True)
+    async def test_disabling_module_mid_workflow(self, workflow):
         """
         Test disabling a module during workflow execution.
         
@@ -354,34 +309,15 @@ class TestModuleEnableDisable:
         3. Disable Brain
         4. Process another frame (only Eye processes)
         """
-        # Initialize components
-        event_bus = EventBus(max_log_size=1000)
-        module_registry = ModuleRegistry()
-        eye_module = EyeModule(event_bus, module_registry)
-        
-        # Mock OpenAI client
-        mock_openai_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '{"text": "I see you!", "speak": "Hello!"}'
-        mock_openai_client.chat.completions.create = AsyncMock(return_value=mock_response)
-        
-        brain_module = BrainModule(event_bus, module_registry, api_key="test_key")
-        brain_module.client = mock_openai_client
-        
-        # Enable both modules
-        module_registry.toggle_module("eye")
-        module_registry.toggle_module("brain")
+        event_bus, module_registry, eye_module, _, event_counter = workflow
         
         # Process first frame
         test_frame = create_test_image_base64(with_face=True)
         await eye_module.process_frame(test_frame)
-        await asyncio.sleep(0.2)
+        await wait_for_event(event_bus, EventType.SYSTEM_ACTION)
         
         # Count initial events
-        events_before = event_bus.get_all_events()
-        action_events_before = [e for e in events_before if e.type == EventType.SYSTEM_ACTION]
-        initial_action_count = len(action_events_before)
+        initial_action_count = event_counter.counts[EventType.SYSTEM_ACTION]
         
         assert initial_action_count >= 1, "Brain should have published SYSTEM_ACTION"
         
@@ -391,15 +327,10 @@ class TestModuleEnableDisable:
         
         # Process second frame
         await eye_module.process_frame(test_frame)
-        await asyncio.sleep(0.2)
-        
-        # Count events after disabling
-        events_after = event_bus.get_all_events()
-        action_events_after = [e for e in events_after if e.type == EventType.SYSTEM_ACTION]
-        final_action_count = len(action_events_after)
+        # Publishing awaits delivery to subscribers, so nothing is still pending
         
         # Should not have new SYSTEM_ACTION events
-        assert final_action_count == initial_action_count, \
+        assert event_counter.counts[EventType.SYSTEM_ACTION] == initial_action_count, \
             "Brain should not publish new SYSTEM_ACTION events when disabled"
 
 
@@ -407,28 +338,22 @@ class TestErrorRecovery:
     """Integration tests for error recovery scenarios."""
     
     @pytest.mark.asyncio
-    async def test_eye_module_recovers_from_invalid_frame(self):
+    async def test_eye_module_recovers_from_invalid_frame(self, event_bus, module_registry, eye_module, event_counter):
         """
         Test that Eye module handles invalid frames gracefully and continues operating.
         
         Property 32: System resilience to module failures.
         """
-        # Initialize components
-        event_bus = EventBus(max_log_size=1000)
-        module_registry = ModuleRegistry()
-        eye_module = EyeModule(event_bus, module_registry)
-        
         # Enable Eye
         module_registry.toggle_module("eye")
         
         # Send invalid frame
         invalid_frame = "not_valid_base64_data"
         await eye_module.process_frame(invalid_frame)
-        await asyncio.sleep(0.1)
+        await wait_for_event(event_bus, EventType.ACTION_ERROR)
         
         # Should have published ERROR event
-        all_events = event_bus.get_all_events()
-        error_events = [e for e in all_events if e.type == EventType.ACTION_ERROR]
+        error_events = event_bus.get_events_by_type(EventType.ACTION_ERROR)
         assert len(error_events) >= 1, "Eye should publish ERROR event for invalid frame"
         
         error_event = error_events[0]
@@ -441,31 +366,20 @@ class TestErrorRecovery:
         # Send valid frame to verify recovery
         valid_frame = create_test_image_base64(with_face=False)
         await eye_module.process_frame(valid_frame)
-        await asyncio.sleep(0.1)
+        await wait_for_event(event_bus, EventType.VISION_EVENT)
         
         # Should have published VISION_EVENT
-        vision_events = [e for e in all_events if e.type == EventType.VISION_EVENT]
-        assert len(vision_events) >= 1, "Eye should recover and process valid frames"
+        assert event_counter.counts[EventType.VISION_EVENT] >= 1, "Eye should recover and process valid frames"
     
     @pytest.mark.asyncio
-    async def test_brain_module_recovers_from_api_failure(self):
+    async def test_brain_module_recovers_from_api_failure(self, event_bus, module_registry, brain_module_factory, event_counter):
         """
         Test that Brain module handles API failures gracefully.
         
         Property 32: System resilience to module failures.
         """
-        # Initialize components
-        event_bus = EventBus(max_log_size=1000)
-        module_registry = ModuleRegistry()
-        
-        # Mock OpenAI client to raise exception
-        mock_openai_client = AsyncMock()
-        mock_openai_client.chat.completions.create = AsyncMock(
-            side_effect=Exception("API connection failed")
-        )
-        
-        brain_module = BrainModule(event_bus, module_registry, api_key="test_key")
-        brain_module.client = mock_openai_client
+        # Brain module whose mocked LLM client always fails
+        brain_module = brain_module_factory(error=Exception("API connection failed"))
         
         # Enable Brain
         module_registry.toggle_module("brain")
@@ -477,11 +391,10 @@ class TestErrorRecovery:
             payload={"detected": True, "object_type": "face", "confidence": 0.9}
         )
         await event_bus.publish(vision_event)
-        await asyncio.sleep(0.2)
+        await wait_for_event(event_bus, EventType.ACTION_ERROR)
         
         # Should have published ERROR event
-        all_events = event_bus.get_all_events()
-        error_events = [e for e in all_events if e.type == EventType.ACTION_ERROR]
+        error_events = event_bus.get_events_by_type(EventType.ACTION_ERROR)
         assert len(error_events) >= 1, "Brain should publish ERROR event on API failure"
         
         error_event = error_events[0]
@@ -489,32 +402,20 @@ class TestErrorRecovery:
         assert "API" in error_event.payload["message"] or "failed" in error_event.payload["message"]
         
         # Should also have fallback SYSTEM_ACTION
-        action_events = [e for e in all_events if e.type == EventType.SYSTEM_ACTION]
-        assert len(action_events) >= 1, "Brain should publish fallback SYSTEM_ACTION"
+        assert event_counter.counts[EventType.SYSTEM_ACTION] >= 1, "Brain should publish fallback SYSTEM_ACTION"
         
         # Module should still be enabled
         assert module_registry.is_enabled("brain")
     
     @pytest.mark.asyncio
-    async def test_system_continues_when_one_module_fails(self):
+    async def test_system_continues_when_one_module_fails(self, event_bus, module_registry, eye_module, brain_module_factory, event_counter):
         """
         Test that the system continues operating when one module fails.
         
         Property 32: System resilience to module failures.
         """
-        # Initialize components
-        event_bus = EventBus(max_log_size=1000)
-        module_registry = ModuleRegistry()
-        eye_module = EyeModule(event_bus, module_registry)
-        
-        # Mock OpenAI client to always fail
-        mock_openai_client = AsyncMock()
-        mock_openai_client.chat.completions.create = AsyncMock(
-            side_effect=Exception("Persistent API failure")
-        )
-        
-        brain_module = BrainModule(event_bus, module_registry, api_key="test_key")
-        brain_module.client = mock_openai_client
+        # Brain module whose mocked LLM client always fails
+        brain_module = brain_module_factory(error=Exception("Persistent API failure"))
         
         # Enable both modules
         module_registry.toggle_module("eye")
@@ -524,32 +425,28 @@ class TestErrorRecovery:
         for i in range(3):
             test_frame = create_test_image_base64(with_face=(i % 2 == 0))
             await eye_module.process_frame(test_frame)
-            await asyncio.sleep(0.2)
+            await wait_for_event(event_bus, EventType.ACTION_ERROR, count=i + 1)
         
         # Verify Eye continued to work despite Brain failures
-        all_events = event_bus.get_all_events()
-        vision_events = [e for e in all_events if e.type == EventType.VISION_EVENT]
-        
-        assert len(vision_events) >= 3, "Eye should continue processing despite Brain failures"
+        assert event_counter.counts[EventType.VISION_EVENT] >= 3, "Eye should continue processing despite Brain failures"
         
         # Verify Brain published error events
-        error_events = [e for e in all_events if e.type == EventType.ACTION_ERROR and e.source_module == "brain"]
-        assert len(error_events) >= 3, "Brain should publish error events for each failure"
+        brain_error_count = sum(
+            1 for e in event_bus.iter_events_by_type(EventType.ACTION_ERROR) if e.source_module == "brain"
+        )
+        assert brain_error_count >= 3, "Brain should publish error events for each failure"
         
         # Both modules should still be enabled
         assert module_registry.is_enabled("eye")
         assert module_registry.is_enabled("brain")
     
     @pytest.mark.asyncio
-    async def test_event_bus_resilience_to_subscriber_failure(self):
+    async def test_event_bus_resilience_to_subscriber_failure(self, event_bus):
         """
         Test that event bus continues delivering to other subscribers when one fails.
         
         Property 32: System resilience to module failures.
         """
-        # Initialize event bus
-        event_bus = EventBus(max_log_size=1000)
-        
         # Track successful deliveries
         successful_deliveries = []
         
@@ -570,7 +467,7 @@ class TestErrorRecovery:
             payload={"test": "data"}
         )
         await event_bus.publish(event)
-        await asyncio.sleep(0.1)
+        # Publishing awaits delivery to subscribers, so nothing is still pending
         
         # Verify successful callback received the event
         assert len(successful_deliveries) == 1, "Working subscriber should receive event despite other subscriber failing"
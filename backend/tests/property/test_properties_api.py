@@ -4,7 +4,6 @@ Property-based tests for API correctness properties.
 
 import pytest
 import asyncio
-from hypothesis import given, strategies as st, settings
 from fastapi.testclient import TestClient
 from backend.app import app
 from backend.core.event_bus import EventBus
@@ -13,21 +12,34 @@ from backend.modules.eye import EyeModule
 import backend.app as app_module
 
 
-def setup_test_app():
-    """Initialize global components for testing."""
+def reset_app_state():
+    """
+    Give the app fresh global components, keeping the ASGI app itself.
+    
+    The globals live in this process only, so under pytest-xdist
+    (`pytest -n auto`) every worker resets its own copy.
+    """
+    previous_eye_module = getattr(app_module, "eye_module", None)
+    if previous_eye_module is not None:
+        previous_eye_module.shutdown()
     app_module.event_bus = EventBus(max_log_size=1000)
     app_module.module_registry = ModuleRegistry()
     app_module.eye_module = EyeModule(app_module.event_bus, app_module.module_registry)
     app_module.brain_module = None  # Don't initialize Brain in tests (no API key needed)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create one test client for the whole session (per xdist worker)."""
     return TestClient(app)
 
 
 class TestAPIProperties:
     """Property-based tests for API correctness properties."""
     
-    @given(module_id=st.sampled_from(["eye", "brain", "mouth", "tentacle"]))
-    @settings(max_examples=100, deadline=None)
-    def test_property_api_module_toggle_behavior(self, module_id):
+    # Four discrete inputs: cover each once instead of sampling 100 examples
+    @pytest.mark.parametrize("module_id", ["eye", "brain", "mouth", "tentacle"])
+    def test_property_api_module_toggle_behavior(self, client, module_id):
         """
         Feature: chimeraforge, Property 27: API module toggle behavior
         Validates: Requirements 10.2
@@ -35,8 +47,8 @@ class TestAPIProperties:
         Property: For any module ID, sending a POST request to /api/modules/{id}/toggle
         should toggle the module's enabled state.
         """
-        # Initialize a fresh test client for each test run
-        client = setup_test_app()
+        # Reset app state for each module; the client is shared
+        reset_app_state()
         
         # Get initial module state via API
         response = client.get("/api/modules")
@@ -94,14 +106,14 @@ class TestAPIProperties:
         assert final_module["description"] == initial_module["description"], "Module description should not change"
         assert final_module["capabilities"] == initial_module["capabilities"], "Module capabilities should not change"
     
-    def test_property_api_module_toggle_invalid_id(self):
+    def test_property_api_module_toggle_invalid_id(self, client):
         """
         Test that toggling an invalid module ID returns 404.
         
         This is an edge case property test to ensure proper error handling.
         """
-        # Initialize a fresh test client
-        client = setup_test_app()
+        # Reset app state; the client is shared
+        reset_app_state()
         
         # Try to toggle a non-existent module
         invalid_ids = ["invalid", "nonexistent", "fake_module", ""]
@@ -1,25 +1,71 @@
 """
 Property-based tests for Module Registry correctness properties.
+
+Each test builds its own event bus and only shares state through
+class-scoped fixtures, with no process-wide globals, so the file is safe
+to run under pytest-xdist (configured in pytest.ini).
 """
 
 import pytest
 import asyncio
 import base64
-import cv2
 import numpy as np
-from unittest.mock import AsyncMock, MagicMock, patch
-from hypothesis import given, strategies as st, settings
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import patch
+from hypothesis import Phase, given, strategies as st, settings
 from backend.core.module_registry import ModuleRegistry, ModuleInfo
 from backend.core.event_bus import EventBus, EventType, Event
 from backend.modules.eye import EyeModule
 from backend.modules.brain import BrainModule, BrainResponse
 
 
+@pytest.fixture(scope="class")
+def registry():
+    """
+    Share one module registry across a test class.
+    
+    Hypothesis runs every example inside a single test call, so tests reset
+    the registry at the start of each example rather than relying on
+    fixture teardown.
+    """
+    return ModuleRegistry()
+
+
+@pytest.fixture(scope="class")
+def eye_module(registry):
+    """
+    Share one Eye module, on its own event bus, across a test class.
+    
+    Loading the detectors and starting the detection pool is the expensive
+    part of an example; tests call reset_eye_module at the start of each
+    example instead of building a new module.
+    """
+    module = EyeModule(EventBus(), registry)
+    yield module
+    module.shutdown()
+    module.event_bus.shutdown()
+
+
+def reset_eye_module(eye_module: EyeModule) -> EventBus:
+    """
+    Clear a shared Eye module's state and event log.
+    
+    Returns:
+        The module's event bus
+    """
+    eye_module.reset_state()
+    eye_module.event_bus.clear_log()
+    return eye_module.event_bus
+
+
 class TestModuleRegistryProperties:
     """Property-based tests for Module Registry correctness properties."""
     
-    @given(module_id=st.sampled_from(["eye", "brain", "mouth", "tentacle"]))
-    def test_property_module_toggle_state_persistence(self, module_id):
+    # Four discrete inputs: cover each once instead of sampling them
+    @pytest.mark.parametrize("module_id", ["eye", "brain", "mouth", "tentacle"])
+    def test_property_module_toggle_state_persistence(self, registry, module_id):
         """
         Feature: chimeraforge, Property 1: Module toggle state persistence
         Validates: Requirements 1.1, 1.2, 1.5
@@ -28,8 +74,8 @@ class TestModuleRegistryProperties:
         the module registry reflecting the new state and the module's abilities being
         available or unavailable accordingly.
         """
-        # Create a fresh registry
-        registry = ModuleRegistry()
+        # Start from a freshly reset registry
+        registry.reset()
         
         # Get initial state
         initial_module = registry.get_module(module_id)
@@ -72,42 +118,41 @@ class TestModuleRegistryProperties:
 
 
 
-# Helper function to generate test images
-def generate_test_image(width: int = 640, height: int = 480, seed: int = 0) -> str:
+# Helper function to generate test frames. Hypothesis draws the same seeds
+# repeatedly, so frames are cached by their arguments.
+@lru_cache(maxsize=2048)
+def generate_test_frame(width: int = 64, height: int = 48, seed: int = 0) -> np.ndarray:
     """
-    Generate a test image as base64 string.
+    Generate a decoded test frame for EyeModule.process_frame_array.
+    
+    Tests that don't exercise decoding pass pixels straight to the Eye
+    module, skipping the base64 and image encode/decode round trip.
     
     Args:
         width: Image width
         height: Image height
-        seed: Random seed for reproducibility
-        
+        seed: Value that selects the (flat) image content
+    
     Returns:
-        Base64-encoded image string
+        Read-only BGR image array (shared between callers)
     """
-    np.random.seed(seed)
-    
-    # Create a random image
-    image = np.random.randint(0, 256, (height, width, 3), dtype=np.uint8)
-    
-    # Encode to JPEG
-    _, buffer = cv2.imencode('.jpg', image)
-    
-    # Convert to base64
-    image_base64 = base64.b64encode(buffer).decode('utf-8')
-    
-    return image_base64
+    # No test looks at pixel values, so a flat image derived from the seed
+    # is enough; it still differs between consecutive seeds
+    image = np.full((height, width, 3), seed & 0xFF, dtype=np.uint8)
+    image.setflags(write=False)
+    return image
 
 
 class TestEyeModuleProperties:
     """Property-based tests for Eye Module correctness properties."""
     
+    @pytest.mark.asyncio
     @given(
         num_frames=st.integers(min_value=1, max_value=10),
         seed=st.integers(min_value=0, max_value=1000)
     )
     @settings(max_examples=100, deadline=None)
-    def test_property_eye_processes_all_frames_when_enabled(self, num_frames, seed):
+    async def test_property_eye_processes_all_frames_when_enabled(self, registry, eye_module, num_frames, seed):
         """
         Feature: chimeraforge, Property 4: Eye module processes all frames when enabled
         Validates: Requirements 2.1
@@ -118,21 +163,16 @@ class TestEyeModuleProperties:
         We verify this by checking that for each frame processed, a VISION_EVENT
         is published to the event bus.
         """
-        # Create fresh instances for each test
-        event_bus = EventBus()
-        registry = ModuleRegistry()
-        eye_module = EyeModule(event_bus, registry)
+        # Reset the shared Eye module, its event bus and the registry
+        event_bus = reset_eye_module(eye_module)
+        registry.reset()
         
         # Enable the Eye module
         registry.toggle_module("eye")
-        assert registry.is_enabled("eye"), "Eye module should be enabled"
         
-        # Generate and process multiple frames
-        for i in range(num_frames):
-            frame_base64 = generate_test_image(seed=seed + i)
-            
-            # Process the frame synchronously using asyncio.run
-            asyncio.run(eye_module.process_frame(frame_base64))
+        # Generate multiple frames and process them concurrently
+        frames = [generate_test_frame(seed=seed + i) for i in range(num_frames)]
+        await asyncio.gather(*(eye_module.process_frame_array(frame) for frame in frames))
         
         # Property: Each frame should result in exactly one VISION_EVENT
         events = event_bus.get_all_events()
@@ -154,18 +194,59 @@ class TestEyeModuleProperties:
 
 
 
+# LLM response shared by the Brain examples; nothing mutates it, and plain
+# namespaces are much cheaper to build than MagicMocks
+_BRAIN_MOCK_RESPONSE = SimpleNamespace(
+    choices=[SimpleNamespace(message=SimpleNamespace(content='{"text": "Test response", "speak": "Hello"}'))]
+)
+
+
+class _FakeCompletions:
+    """Stand-in for the LLM client's chat.completions endpoint."""
+    
+    def __init__(self, error: Optional[Exception] = None):
+        self.error = error
+        self.calls = 0
+    
+    async def create(self, **kwargs):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return _BRAIN_MOCK_RESPONSE
+
+
+class _FakeClient:
+    """
+    Lightweight fake LLM client.
+    
+    Avoids MagicMock's lazily created attributes and call recording; the
+    number of completion calls is kept in `chat.completions.calls`.
+    """
+    
+    def __init__(self, error: Optional[Exception] = None):
+        self.chat = SimpleNamespace(completions=_FakeCompletions(error))
+
+
 class TestBrainModuleProperties:
     """Property-based tests for Brain Module correctness properties."""
     
+    @pytest.fixture(scope="class")
+    def mock_openai_class(self):
+        """Patch the LLM client class once for every example in the class."""
+        with patch('backend.modules.brain.AsyncOpenAI') as mock_openai:
+            yield mock_openai
+    
+    # Discrete axes are parametrized; Hypothesis only draws the continuous ones
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("detected", [True, False])
+    @pytest.mark.parametrize("object_type", ["face", "person", "unknown"])
     @given(
-        detected=st.booleans(),
-        object_type=st.sampled_from(["face", "person", "unknown"]),
         confidence=st.floats(min_value=0.0, max_value=1.0),
         seed=st.integers(min_value=0, max_value=1000)
     )
-    @settings(max_examples=100, deadline=None)
-    def test_property_brain_generates_responses_for_vision_events(
-        self, detected, object_type, confidence, seed
+    @settings(max_examples=25, deadline=None, phases=[Phase.explicit, Phase.reuse, Phase.generate])
+    async def test_property_brain_generates_responses_for_vision_events(
+        self, mock_openai_class, registry, detected, object_type, confidence, seed
     ):
         """
         Feature: chimeraforge, Property 7: Brain generates responses for vision events
@@ -177,87 +258,66 @@ class TestBrainModuleProperties:
         We verify this by checking that for each VISION_EVENT processed, a SYSTEM_ACTION
         event is published to the event bus.
         """
-        # Create fresh instances for each test
+        # Create a fresh event bus and reset the shared registry
         event_bus = EventBus()
-        registry = ModuleRegistry()
+        registry.reset()
         
-        # Mock the OpenAI client to avoid actual API calls
-        with patch('backend.modules.brain.AsyncOpenAI') as mock_openai:
-            # Create a mock client
-            mock_client = MagicMock()
-            mock_openai.return_value = mock_client
-            
-            # Create mock response
-            mock_response = MagicMock()
-            mock_response.choices = [MagicMock()]
-            mock_response.choices[0].message.content = '{"text": "Test response", "speak": "Hello"}'
-            
-            # Set up the async mock
-            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-            
-            # Create Brain module with mocked client
-            brain_module = BrainModule(event_bus, registry, api_key="test-key")
-            
-            # Enable the Brain module
-            registry.toggle_module("brain")
-            assert registry.is_enabled("brain"), "Brain module should be enabled"
-            
-            # Create a VISION_EVENT with the given parameters
-            vision_event = Event.create(
-                source_module="eye",
-                type=EventType.VISION_EVENT,
-                payload={
-                    "detected": detected,
-                    "object_type": object_type if detected else None,
-                    "confidence": confidence if detected else 0.0
-                }
-            )
-            
-            # Process the event synchronously using asyncio.run
-            asyncio.run(brain_module.on_event(vision_event))
-            
-            # Property: The Brain should generate a response (call the LLM)
-            # Verify that the OpenAI API was called
-            mock_client.chat.completions.create.assert_called_once()
-            
-            # Property: A SYSTEM_ACTION event should be published
-            events = event_bus.get_all_events()
-            
-            # Filter for SYSTEM_ACTION events from brain
-            system_action_events = [
-                e for e in events 
-                if e.type == EventType.SYSTEM_ACTION and e.source_module == "brain"
-            ]
-            
-            # Check that exactly one SYSTEM_ACTION was published
-            assert len(system_action_events) == 1, \
-                f"Expected 1 SYSTEM_ACTION event, but got {len(system_action_events)}"
-            
-            # Verify the event structure
-            action_event = system_action_events[0]
-            assert "text" in action_event.payload, \
-                "SYSTEM_ACTION event should have 'text' field in payload"
-            assert isinstance(action_event.payload["text"], str), \
-                "SYSTEM_ACTION 'text' field should be a string"
-            assert len(action_event.payload["text"]) > 0, \
-                "SYSTEM_ACTION 'text' field should not be empty"
+        # The LLM client class is patched once for the class; each example
+        # gets a fresh fake client, so no state carries over between examples
+        fake_client = _FakeClient()
+        mock_openai_class.return_value = fake_client
+        
+        # Create Brain module with mocked client
+        brain_module = BrainModule(event_bus, registry, api_key="test-key")
+        
+        # Enable the Brain module
+        registry.toggle_module("brain")
+        
+        # Create a VISION_EVENT with the given parameters
+        vision_event = Event.create(
+            source_module="eye",
+            type=EventType.VISION_EVENT,
+            payload={
+                "detected": detected,
+                "object_type": object_type if detected else None,
+                "confidence": confidence if detected else 0.0
+            }
+        )
+        
+        # Process the event
+        await brain_module.on_event(vision_event)
+        
+        # Property: The Brain should generate a response (call the LLM)
+        # Verify that the OpenAI API was called
+        assert fake_client.chat.completions.calls == 1, "LLM should be called once"
+        
+        # Property: A SYSTEM_ACTION event should be published
+        system_action_events = event_bus.get_events_by(EventType.SYSTEM_ACTION, "brain")
+        
+        # Check that exactly one SYSTEM_ACTION was published
+        assert len(system_action_events) == 1, \
+            f"Expected 1 SYSTEM_ACTION event, but got {len(system_action_events)}"
+        
+        # Verify the event structure
+        action_event = system_action_events[0]
+        assert "text" in action_event.payload, \
+            "SYSTEM_ACTION event should have 'text' field in payload"
+        assert isinstance(action_event.payload["text"], str), \
+            "SYSTEM_ACTION 'text' field should be a string"
+        assert len(action_event.payload["text"]) > 0, \
+            "SYSTEM_ACTION 'text' field should not be empty"
 
 
 class TestModuleErrorHandlingProperties:
     """Property-based tests for Module Error Handling correctness properties."""
     
-    @given(
-        module_type=st.sampled_from(["eye", "brain"]),
-        error_scenario=st.sampled_from([
-            "invalid_base64",
-            "empty_data",
-            "corrupted_image",
-            "api_failure"
-        ]),
-        seed=st.integers(min_value=0, max_value=1000)
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_property_module_error_event_publishing(self, module_type, error_scenario, seed):
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error_scenario", [
+        "invalid_base64",
+        "empty_data",
+        "corrupted_image"
+    ])
+    async def test_property_eye_error_event_publishing(self, registry, eye_module, error_scenario):
         """
         Feature: chimeraforge, Property 31: Module error event publishing
         Validates: Requirements 12.1
@@ -265,150 +325,142 @@ class TestModuleErrorHandlingProperties:
         Property: For any error encountered during module processing, the module
         should publish an ERROR event to the Event Bus.
         
-        We verify this by triggering various error conditions in modules and checking
+        We verify this by feeding the Eye module invalid frames and checking
         that ACTION_ERROR events are published with appropriate error information.
         """
-        # Create fresh instances for each test
+        # Reset the shared Eye module, its event bus and the registry
+        event_bus = reset_eye_module(eye_module)
+        registry.reset()
+        
+        registry.toggle_module("eye")
+        assert registry.is_enabled("eye"), "Eye module should be enabled"
+        
+        # Generate error-inducing input based on scenario
+        if error_scenario == "invalid_base64":
+            # Invalid base64 string
+            frame_data = "not_valid_base64!@#$%"
+        elif error_scenario == "empty_data":
+            # Empty string
+            frame_data = ""
+        else:
+            # Valid base64 but not a valid image
+            frame_data = base64.b64encode(b"not an image").decode('utf-8')
+        
+        # Process the frame
+        await eye_module.process_frame(frame_data)
+        
+        # Property: An ERROR event should be published for error scenarios
+        error_events = event_bus.get_events_by(EventType.ACTION_ERROR, "eye")
+        
+        assert len(error_events) >= 1, \
+            f"Expected at least 1 ACTION_ERROR event for scenario '{error_scenario}', but got {len(error_events)}"
+        
+        # Verify error event structure
+        error_event = error_events[0]
+        assert "error_type" in error_event.payload, \
+            "ERROR event should have 'error_type' field in payload"
+        assert "message" in error_event.payload, \
+            "ERROR event should have 'message' field in payload"
+        assert "details" in error_event.payload, \
+            "ERROR event should have 'details' field in payload"
+        assert "recoverable" in error_event.payload, \
+            "ERROR event should have 'recoverable' field in payload"
+        
+        # Verify error_type is a string
+        assert isinstance(error_event.payload["error_type"], str), \
+            "error_type should be a string"
+        
+        # Verify message is a string
+        assert isinstance(error_event.payload["message"], str), \
+            "message should be a string"
+        
+        # Verify recoverable is a boolean
+        assert isinstance(error_event.payload["recoverable"], bool), \
+            "recoverable should be a boolean"
+    
+    @pytest.mark.asyncio
+    async def test_property_brain_error_event_publishing(self, registry):
+        """
+        Feature: chimeraforge, Property 31: Module error event publishing
+        Validates: Requirements 12.1
+        
+        Property: For any error encountered during module processing, the module
+        should publish an ERROR event to the Event Bus.
+        
+        We verify this by making the LLM call fail and checking that the Brain
+        module publishes an external_service ACTION_ERROR event.
+        """
+        # Create a fresh event bus and reset the shared registry
         event_bus = EventBus()
-        registry = ModuleRegistry()
+        registry.reset()
         
-        if module_type == "eye":
-            # Test Eye module error handling
-            eye_module = EyeModule(event_bus, registry)
-            registry.toggle_module("eye")
-            assert registry.is_enabled("eye"), "Eye module should be enabled"
+        # Simulate API failure
+        failing_client = _FakeClient(error=Exception("API connection failed"))
+        with patch('backend.modules.brain.AsyncOpenAI', return_value=failing_client):
+            # Create Brain module with mocked client
+            brain_module = BrainModule(event_bus, registry, api_key="test-key")
             
-            # Generate error-inducing input based on scenario
-            if error_scenario == "invalid_base64":
-                # Invalid base64 string
-                frame_data = "not_valid_base64!@#$%"
-            elif error_scenario == "empty_data":
-                # Empty string
-                frame_data = ""
-            elif error_scenario == "corrupted_image":
-                # Valid base64 but not a valid image
-                frame_data = base64.b64encode(b"not an image").decode('utf-8')
-            else:
-                # Use valid image for other scenarios
-                frame_data = generate_test_image(seed=seed)
+            # Enable the Brain module
+            registry.toggle_module("brain")
+            assert registry.is_enabled("brain"), "Brain module should be enabled"
             
-            # Process the frame
-            asyncio.run(eye_module.process_frame(frame_data))
+            # Create a VISION_EVENT
+            vision_event = Event.create(
+                source_module="eye",
+                type=EventType.VISION_EVENT,
+                payload={
+                    "detected": True,
+                    "object_type": "face",
+                    "confidence": 0.8
+                }
+            )
             
-            # Property: An ERROR event should be published for error scenarios
-            events = event_bus.get_all_events()
+            # Process the event
+            await brain_module.on_event(vision_event)
             
-            # For error scenarios, we expect an ACTION_ERROR event
-            if error_scenario in ["invalid_base64", "empty_data", "corrupted_image"]:
-                error_events = [
-                    e for e in events 
-                    if e.type == EventType.ACTION_ERROR and e.source_module == "eye"
-                ]
-                
-                assert len(error_events) >= 1, \
-                    f"Expected at least 1 ACTION_ERROR event for scenario '{error_scenario}', but got {len(error_events)}"
-                
-                # Verify error event structure
-                error_event = error_events[0]
-                assert "error_type" in error_event.payload, \
-                    "ERROR event should have 'error_type' field in payload"
-                assert "message" in error_event.payload, \
-                    "ERROR event should have 'message' field in payload"
-                assert "details" in error_event.payload, \
-                    "ERROR event should have 'details' field in payload"
-                assert "recoverable" in error_event.payload, \
-                    "ERROR event should have 'recoverable' field in payload"
-                
-                # Verify error_type is a string
-                assert isinstance(error_event.payload["error_type"], str), \
-                    "error_type should be a string"
-                
-                # Verify message is a string
-                assert isinstance(error_event.payload["message"], str), \
-                    "message should be a string"
-                
-                # Verify recoverable is a boolean
-                assert isinstance(error_event.payload["recoverable"], bool), \
-                    "recoverable should be a boolean"
-        
-        elif module_type == "brain":
-            # Test Brain module error handling
-            with patch('backend.modules.brain.AsyncOpenAI') as mock_openai:
-                # Create a mock client
-                mock_client = MagicMock()
-                mock_openai.return_value = mock_client
-                
-                if error_scenario == "api_failure":
-                    # Simulate API failure
-                    mock_client.chat.completions.create = AsyncMock(
-                        side_effect=Exception("API connection failed")
-                    )
-                else:
-                    # For other scenarios, use normal mock
-                    mock_response = MagicMock()
-                    mock_response.choices = [MagicMock()]
-                    mock_response.choices[0].message.content = '{"text": "Test response"}'
-                    mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-                
-                # Create Brain module with mocked client
-                brain_module = BrainModule(event_bus, registry, api_key="test-key")
-                
-                # Enable the Brain module
-                registry.toggle_module("brain")
-                assert registry.is_enabled("brain"), "Brain module should be enabled"
-                
-                # Create a VISION_EVENT
-                vision_event = Event.create(
-                    source_module="eye",
-                    type=EventType.VISION_EVENT,
-                    payload={
-                        "detected": True,
-                        "object_type": "face",
-                        "confidence": 0.8
-                    }
-                )
-                
-                # Process the event
-                asyncio.run(brain_module.on_event(vision_event))
-                
-                # Property: For API failure, an ERROR event should be published
-                if error_scenario == "api_failure":
-                    events = event_bus.get_all_events()
-                    error_events = [
-                        e for e in events 
-                        if e.type == EventType.ACTION_ERROR and e.source_module == "brain"
-                    ]
-                    
-                    assert len(error_events) >= 1, \
-                        f"Expected at least 1 ACTION_ERROR event for API failure, but got {len(error_events)}"
-                    
-                    # Verify error event structure
-                    error_event = error_events[0]
-                    assert "error_type" in error_event.payload, \
-                        "ERROR event should have 'error_type' field in payload"
-                    assert "message" in error_event.payload, \
-                        "ERROR event should have 'message' field in payload"
-                    assert "details" in error_event.payload, \
-                        "ERROR event should have 'details' field in payload"
-                    assert "recoverable" in error_event.payload, \
-                        "ERROR event should have 'recoverable' field in payload"
-                    
-                    # Verify error_type is "external_service" for API failures
-                    assert error_event.payload["error_type"] == "external_service", \
-                        f"Expected error_type 'external_service', got '{error_event.payload['error_type']}'"
+            # Property: For API failure, an ERROR event should be published
+            error_events = event_bus.get_events_by(EventType.ACTION_ERROR, "brain")
+            
+            assert len(error_events) >= 1, \
+                f"Expected at least 1 ACTION_ERROR event for API failure, but got {len(error_events)}"
+            
+            # Verify error event structure
+            error_event = error_events[0]
+            assert "error_type" in error_event.payload, \
+                "ERROR event should have 'error_type' field in payload"
+            assert "message" in error_event.payload, \
+                "ERROR event should have 'message' field in payload"
+            assert "details" in error_event.payload, \
+                "ERROR event should have 'details' field in payload"
+            assert "recoverable" in error_event.payload, \
+                "ERROR event should have 'recoverable' field in payload"
+            
+            # Verify error_type is "external_service" for API failures
+            assert error_event.payload["error_type"] == "external_service", \
+                f"Expected error_type 'external_service', got '{error_event.payload['error_type']}'"
+
+
+# Frames that make the Eye module fail, cycled through by the resilience test
+_INVALID_FRAMES = (
+    "invalid_base64_data!@#$",
+    "",
+    "not-valid-base64",
+    base64.b64encode(b"corrupted image data").decode('utf-8')
+)
 
 
 class TestSystemResilienceProperties:
     """Property-based tests for System Resilience correctness properties."""
     
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("failing_module", ["eye", "brain"])
     @given(
-        failing_module=st.sampled_from(["eye", "brain"]),
         num_operations=st.integers(min_value=1, max_value=5),
         seed=st.integers(min_value=0, max_value=1000)
     )
-    @settings(max_examples=100, deadline=None)
-    def test_property_system_resilience_to_module_failures(
-        self, failing_module, num_operations, seed
+    @settings(max_examples=25, deadline=None, phases=[Phase.explicit, Phase.reuse, Phase.generate])
+    async def test_property_system_resilience_to_module_failures(
+        self, registry, eye_module, failing_module, num_operations, seed
     ):
         """
         Feature: chimeraforge, Property 32: System resilience to module failures
@@ -423,34 +475,23 @@ class TestSystemResilienceProperties:
         3. Ensuring other modules can still process events
         4. Ensuring the system publishes error events but doesn't crash
         """
-        # Create fresh instances for each test
-        event_bus = EventBus()
-        registry = ModuleRegistry()
+        # Reset the shared Eye module and registry; the Brain gets a fresh bus
+        event_bus = reset_eye_module(eye_module) if failing_module == "eye" else EventBus()
+        registry.reset()
         
         # Enable all modules
         registry.toggle_module("eye")
         registry.toggle_module("brain")
-        assert registry.is_enabled("eye"), "Eye module should be enabled"
-        assert registry.is_enabled("brain"), "Brain module should be enabled"
         
         if failing_module == "eye":
             # Test Eye module failure resilience
-            eye_module = EyeModule(event_bus, registry)
-            
             # Property 1: System should handle invalid inputs gracefully
             for i in range(num_operations):
-                # Generate invalid input that will cause Eye module to fail
-                invalid_inputs = [
-                    "invalid_base64_data!@#$",
-                    "",
-                    "not-valid-base64",
-                    base64.b64encode(b"corrupted image data").decode('utf-8')
-                ]
-                
-                invalid_input = invalid_inputs[i % len(invalid_inputs)]
+                # Pick an invalid input that will cause Eye module to fail
+                invalid_input = _INVALID_FRAMES[i % len(_INVALID_FRAMES)]
                 
                 # Process the invalid frame - should not crash
-                asyncio.run(eye_module.process_frame(invalid_input))
+                await eye_module.process_frame(invalid_input)
             
             # Property 2: Event bus should still be operational
             events = event_bus.get_all_events()
@@ -458,25 +499,17 @@ class TestSystemResilienceProperties:
                 "Event bus should have events even after Eye module failures"
             
             # Property 3: Error events should be published for failures
-            error_events = [
-                e for e in events 
-                if e.type == EventType.ACTION_ERROR and e.source_module == "eye"
-            ]
-            assert len(error_events) > 0, \
+            assert event_bus.count_events(EventType.ACTION_ERROR, "eye") > 0, \
                 "Eye module should publish error events for failures"
             
             # Property 4: Vision events should still be published (graceful degradation)
-            vision_events = [
-                e for e in events 
-                if e.type == EventType.VISION_EVENT and e.source_module == "eye"
-            ]
-            assert len(vision_events) > 0, \
+            assert event_bus.count_events(EventType.VISION_EVENT, "eye") > 0, \
                 "Eye module should still publish vision events even after errors (graceful degradation)"
             
             # Property 5: System should continue accepting new operations
             # Try processing a valid frame after failures
-            valid_frame = generate_test_image(seed=seed)
-            asyncio.run(eye_module.process_frame(valid_frame))
+            valid_frame = generate_test_frame(seed=seed)
+            await eye_module.process_frame_array(valid_frame)
             
             # Verify the system recovered and processed the valid frame
             events_after_recovery = event_bus.get_all_events()
@@ -485,16 +518,9 @@ class TestSystemResilienceProperties:
         
         elif failing_module == "brain":
             # Test Brain module failure resilience
-            with patch('backend.modules.brain.AsyncOpenAI') as mock_openai:
-                # Create a mock client that fails
-                mock_client = MagicMock()
-                mock_openai.return_value = mock_client
-                
-                # Simulate API failures
-                mock_client.chat.completions.create = AsyncMock(
-                    side_effect=Exception("API connection failed")
-                )
-                
+            # Simulate API failures
+            failing_client = _FakeClient(error=Exception("API connection failed"))
+            with patch('backend.modules.brain.AsyncOpenAI', return_value=failing_client):
                 # Create Brain module with failing client
                 brain_module = BrainModule(event_bus, registry, api_key="test-key")
                 
@@ -512,7 +538,7 @@ class TestSystemResilienceProperties:
                     )
                     
                     # Process the event - should not crash
-                    asyncio.run(brain_module.on_event(vision_event))
+                    await brain_module.on_event(vision_event)
                 
                 # Property 2: Event bus should still be operational
                 events = event_bus.get_all_events()
@@ -520,19 +546,12 @@ class TestSystemResilienceProperties:
                     "Event bus should have events even after Brain module failures"
                 
                 # Property 3: Error events should be published for failures
-                error_events = [
-                    e for e in events 
-                    if e.type == EventType.ACTION_ERROR and e.source_module == "brain"
-                ]
-                assert len(error_events) > 0, \
+                assert event_bus.count_events(EventType.ACTION_ERROR, "brain") > 0, \
                     "Brain module should publish error events for API failures"
                 
                 # Property 4: System actions should still be published (graceful degradation)
                 # Brain module publishes fallback responses even when API fails
-                system_action_events = [
-                    e for e in events 
-                    if e.type == EventType.SYSTEM_ACTION and e.source_module == "brain"
-                ]
+                system_action_events = event_bus.get_events_by(EventType.SYSTEM_ACTION, "brain")
                 assert len(system_action_events) > 0, \
                     "Brain module should publish fallback system actions even after API failures"
                 
@@ -556,7 +575,7 @@ class TestSystemResilienceProperties:
                     }
                 )
                 
-                asyncio.run(brain_module.on_event(recovery_event))
+                await brain_module.on_event(recovery_event)
                 
                 # Verify the system continues to operate
                 events_after_recovery = event_bus.get_all_events()
@@ -571,7 +590,7 @@ class TestSystemResilienceProperties:
             payload={"module_id": "test", "enabled": True}
         )
         
-        asyncio.run(event_bus.publish(test_event))
+        await event_bus.publish(test_event)
         
         final_events = event_bus.get_all_events()
         assert any(e.id == test_event.id for e in final_events), \
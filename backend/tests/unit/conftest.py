@@ -0,0 +1,21 @@
+"""
+Shared fixtures for the unit tests.
+"""
+
+import pytest
+from backend.core.event_bus import EventBus
+
+
+@pytest.fixture(scope="session")
+def session_bus():
+    """Create one event bus for the whole test session."""
+    bus = EventBus()
+    yield bus
+    bus.shutdown()
+
+
+@pytest.fixture
+def bus(session_bus):
+    """Provide the session event bus, reset to a fresh state."""
+    session_bus.reset()
+    return session_bus
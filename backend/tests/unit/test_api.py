@@ -4,6 +4,7 @@ Unit tests for FastAPI application endpoints.
 
 import pytest
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from backend.app import app
 from backend.core.event_bus import EventBus
 from backend.core.module_registry import ModuleRegistry
@@ -12,16 +13,37 @@ from backend.modules.brain import BrainModule
 import backend.app as app_module
 
 
-@pytest.fixture
+# No test publishes more than a handful of events (keep >= the largest
+# /api/logs limit queried below)
+TEST_LOG_SIZE = 16
+
+
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client for the FastAPI app."""
+    """Create one test client for the FastAPI app, shared by the module's tests."""
     # Initialize global components for testing
-    app_module.event_bus = EventBus(max_log_size=1000)
+    app_module.event_bus = EventBus(max_log_size=TEST_LOG_SIZE)
     app_module.module_registry = ModuleRegistry()
     app_module.eye_module = EyeModule(app_module.event_bus, app_module.module_registry)
     app_module.brain_module = None  # Don't initialize Brain in tests (no API key needed)
     
-    return TestClient(app)
+    yield TestClient(app)
+    app_module.eye_module.shutdown()
+
+
+@pytest.fixture
+async def aclient(client):
+    """Create an async client that drives the app on the test's event loop."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(autouse=True)
+def reset_app_state(client):
+    """Clear the events and module states left behind by the previous test."""
+    app_module.event_bus.clear_log()
+    app_module.module_registry.reset()
+    app_module.eye_module.reset_state()
 
 
 def test_root_endpoint(client):
@@ -44,7 +66,7 @@ def test_get_modules(client):
     
     # Check module structure
     module_ids = {m["id"] for m in modules}
-    assert module_ids == {"eye", "brain", "mouth", "tentacle"}
+    assert module_ids == {"eye", "brain", "mouth", "ear"}
     
     # All modules should start disabled
     for module in modules:
@@ -73,6 +95,16 @@ def test_toggle_module(client):
     assert module["enabled"] is False
 
 
+def test_get_modules_reflects_toggle(client):
+    """Test GET /api/modules is up to date after a module is toggled."""
+    client.get("/api/modules")
+    client.post("/api/modules/eye/toggle")
+    
+    modules = {m["id"]: m for m in client.get("/api/modules").json()}
+    assert modules["eye"]["enabled"] is True
+    assert modules["brain"]["enabled"] is False
+
+
 def test_toggle_invalid_module(client):
     """Test toggling non-existent module returns 404."""
     response = client.post("/api/modules/invalid/toggle")
@@ -97,6 +129,35 @@ def test_publish_event(client):
     assert event["payload"]["message"] == "test event"
 
 
+def test_publish_event_rejects_unserializable_payload(client):
+    """Test POST /api/events rejects payloads that can't be encoded, without logging them."""
+    event_data = {
+        "source_module": "test",
+        "type": "TEST_EVENT",
+        "payload": {"n": 2 ** 70}
+    }
+    
+    response = client.post("/api/events", json=event_data)
+    assert response.status_code == 400
+    
+    # Nothing was logged, so the log stays readable
+    response = client.get("/api/logs")
+    assert response.status_code == 200
+    assert all(e["type"] != "TEST_EVENT" for e in response.json())
+
+
+def test_openapi_documents_request_bodies(client):
+    """Test that bodies decoded with msgspec still appear in the OpenAPI schema."""
+    paths = client.get("/openapi.json").json()["paths"]
+    
+    events_body = paths["/api/events"]["post"]["requestBody"]
+    events_schema = events_body["content"]["application/json"]["schema"]
+    assert set(events_schema["required"]) == {"source_module", "type", "payload"}
+    
+    frame_body = paths["/api/vision/frame"]["post"]["requestBody"]
+    assert frame_body["content"]["application/json"]["schema"]["required"] == ["frame"]
+
+
 def test_get_logs(client):
     """Test GET /api/logs returns event log."""
     # Publish an event first
@@ -126,16 +187,44 @@ def test_get_logs_with_limit(client):
     assert len(logs) <= 5
 
 
-def test_process_vision_frame_invalid_base64(client):
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_process_vision_frame_invalid_base64(aclient):
     """Test POST /api/vision/frame handles invalid base64."""
     # Enable eye module first
-    client.post("/api/modules/eye/toggle")
+    await aclient.post("/api/modules/eye/toggle")
     
     frame_data = {
         "frame": "invalid_base64_data"
     }
     
     # Should not crash, but may return error or empty events
-    response = client.post("/api/vision/frame", json=frame_data)
+    response = await aclient.post("/api/vision/frame", json=frame_data)
     # Accept either success with no events or error
     assert response.status_code in [200, 500]
+
+
+@pytest.mark.asyncio
+async def test_process_vision_frame_binary(aclient):
+    """Test POST /api/vision/frame-binary accepts raw image bytes."""
+    import cv2
+    import numpy as np
+    
+    # Enable eye module first
+    await aclient.post("/api/modules/eye/toggle")
+    
+    # A blank frame doesn't need high JPEG quality
+    _, buffer = cv2.imencode(
+        '.jpg', np.zeros((480, 640, 3), dtype=np.uint8), [int(cv2.IMWRITE_JPEG_QUALITY), 50]
+    )
+    
+    response = await aclient.post(
+        "/api/vision/frame-binary",
+        content=buffer.tobytes(),
+        headers={"Content-Type": "application/octet-stream"}
+    )
+    assert response.status_code == 200
+    
+    data = response.json()
+    vision_events = [e for e in data["events_generated"] if e["type"] == "VISION_EVENT"]
+    assert len(vision_events) == 1
@@ -3,62 +3,136 @@ Unit tests for the Brain Module.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import count
+from types import SimpleNamespace
+from typing import Optional
+from uuid import UUID
+from unittest.mock import AsyncMock, patch
 from backend.modules.brain import BrainModule, BrainResponse
 from backend.core.event_bus import Event, EventBus, EventType
 from backend.core.module_registry import ModuleRegistry
 
 
-@pytest.fixture
+@dataclass
+class _StubModel:
+    """Stand-in for genai.GenerativeModel exposing only generate_content_async."""
+    text: str = '{"text": "Test response"}'
+    # Raised by generate_content_async instead of returning a response, when set
+    error: Optional[Exception] = None
+    
+    async def generate_content_async(self, prompt, **kwargs):
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(text=self.text)
+
+
+@contextmanager
+def _stub_genai():
+    """Stub out the Gemini SDK calls made while building a BrainModule."""
+    with patch("backend.modules.brain.genai.configure"), \
+            patch("backend.modules.brain.genai.GenerativeModel", return_value=_StubModel()):
+        yield
+
+
+@pytest.fixture(scope="module")
 def event_bus():
-    """Create an event bus for testing."""
-    return EventBus()
+    """Create an event bus shared by the tests in this file."""
+    bus = EventBus()
+    yield bus
+    bus.shutdown()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def registry():
-    """Create a module registry for testing."""
-    reg = ModuleRegistry()
-    # Enable the brain module for testing
-    reg.toggle_module("brain")
-    return reg
+    """Create a module registry shared by the tests in this file."""
+    return ModuleRegistry()
+
+
+@pytest.fixture(scope="module")
+def captured_by_type(event_bus):
+    """Capture published events, grouped by event type, for the whole file."""
+    events = defaultdict(list)
+    
+    async def capture_event(event):
+        events[event.type].append(event)
+    
+    event_bus.subscribe("test_capture", capture_event)
+    return events
+
+
+@pytest.fixture(autouse=True)
+def _reset(event_bus, registry, captured_by_type):
+    """Return the shared bus and registry to a fresh state with only the brain enabled."""
+    event_bus.clear_log()
+    captured_by_type.clear()
+    # Keep the shared capture subscriber; drop everything tests added
+    for module_id in list(event_bus._subscribers):
+        if module_id != "test_capture":
+            event_bus.unsubscribe(module_id)
+    registry.reset()
+    registry.toggle_module("brain")
 
 
 @pytest.fixture
-def brain_module(event_bus, registry):
-    """Create a Brain module for testing."""
-    # Mock the AsyncOpenAI client to avoid initialization issues
-    with patch('backend.modules.brain.AsyncOpenAI') as mock_openai:
-        mock_client = MagicMock()
-        mock_openai.return_value = mock_client
+def make_event(monkeypatch):
+    """Build events with deterministic, counter-based ids."""
+    ids = count(1)
+    monkeypatch.setattr(
+        "backend.core.event_bus._new_event_id",
+        lambda: str(UUID(int=next(ids)))
+    )
+    
+    def _make_event(type, payload, source="eye"):
+        return Event.create(source_module=source, type=type, payload=payload)
+    
+    return _make_event
+
+
+@pytest.fixture(scope="module")
+def _shared_brain(event_bus, registry):
+    """Build one Brain module for the whole file, with the Gemini SDK stubbed."""
+    with _stub_genai():
         brain = BrainModule(event_bus, registry, api_key="test-key")
-        brain.client = mock_client
-        yield brain
+    yield brain
+
+
+@pytest.fixture
+def brain_module(_shared_brain, event_bus):
+    """Hand out the shared Brain module with fresh per-test state."""
+    brain = _shared_brain
+    # _reset dropped the subscription made in __init__
+    event_bus.subscribe(brain.module_id, brain.on_event)
+    brain.model = _StubModel()
+    brain.last_process_time = 0
+    yield brain
+    # Drop per-test overrides such as a mocked generate_response
+    brain.__dict__.pop("generate_response", None)
 
 
 @pytest.mark.asyncio
 async def test_brain_module_initialization(event_bus, registry):
     """Test that Brain module initializes correctly."""
-    with patch('backend.modules.brain.AsyncOpenAI') as mock_openai:
-        mock_client = MagicMock()
-        mock_openai.return_value = mock_client
+    with _stub_genai():
         brain = BrainModule(event_bus, registry, api_key="test-key")
-        assert brain.module_id == "brain"
-        assert brain.event_bus == event_bus
-        assert brain.registry == registry
-        assert brain.client is not None
+    assert brain.module_id == "brain"
+    assert brain.event_bus == event_bus
+    assert brain.registry == registry
+    assert brain.model is not None
 
 
 @pytest.mark.asyncio
 async def test_brain_module_requires_api_key(event_bus, registry):
     """Test that Brain module requires an API key."""
     with patch.dict('os.environ', {}, clear=True):
-        with pytest.raises(ValueError, match="OpenAI API key not provided"):
+        with pytest.raises(ValueError, match="Gemini API key not provided"):
             BrainModule(event_bus, registry)
 
 
 @pytest.mark.asyncio
-async def test_brain_processes_vision_event_when_enabled(brain_module):
+async def test_brain_processes_vision_event_when_enabled(brain_module, make_event):
     """Test that Brain processes VISION_EVENT when enabled."""
     # Mock the generate_response method
     brain_module.generate_response = AsyncMock(return_value=BrainResponse(
@@ -67,11 +141,8 @@ async def test_brain_processes_vision_event_when_enabled(brain_module):
     ))
     
     # Create a vision event
-    vision_event = Event.create(
-        source_module="eye",
-        type=EventType.VISION_EVENT,
-        payload={"detected": True, "object_type": "face", "confidence": 0.9}
-    )
+    vision_event = make_event(EventType.VISION_EVENT, {"detected": True, "object_type": "face", "confidence": 0.9})
+    assert vision_event.id == str(UUID(int=1))
     
     # Process the event
     await brain_module.on_event(vision_event)
@@ -81,7 +152,7 @@ async def test_brain_processes_vision_event_when_enabled(brain_module):
 
 
 @pytest.mark.asyncio
-async def test_brain_ignores_events_when_disabled(brain_module):
+async def test_brain_ignores_events_when_disabled(brain_module, make_event):
     """Test that Brain ignores events when disabled."""
     # Disable the brain module
     brain_module.registry.toggle_module("brain")
@@ -90,11 +161,7 @@ async def test_brain_ignores_events_when_disabled(brain_module):
     brain_module.generate_response = AsyncMock()
     
     # Create a vision event
-    vision_event = Event.create(
-        source_module="eye",
-        type=EventType.VISION_EVENT,
-        payload={"detected": True}
-    )
+    vision_event = make_event(EventType.VISION_EVENT, {"detected": True})
     
     # Process the event
     await brain_module.on_event(vision_event)
@@ -104,17 +171,13 @@ async def test_brain_ignores_events_when_disabled(brain_module):
 
 
 @pytest.mark.asyncio
-async def test_brain_ignores_non_vision_events(brain_module):
+async def test_brain_ignores_non_vision_events(brain_module, make_event):
     """Test that Brain ignores non-VISION_EVENT events."""
     # Mock the generate_response method
     brain_module.generate_response = AsyncMock()
     
     # Create a non-vision event
-    other_event = Event.create(
-        source_module="mouth",
-        type=EventType.SPEECH_COMPLETE,
-        payload={}
-    )
+    other_event = make_event(EventType.SPEECH_COMPLETE, {}, source="mouth")
     
     # Process the event
     await brain_module.on_event(other_event)
@@ -124,16 +187,8 @@ async def test_brain_ignores_non_vision_events(brain_module):
 
 
 @pytest.mark.asyncio
-async def test_brain_publishes_system_action(brain_module, event_bus):
+async def test_brain_publishes_system_action(brain_module, captured_by_type):
     """Test that Brain publishes SYSTEM_ACTION events."""
-    # Track published events
-    published_events = []
-    
-    async def capture_event(event):
-        published_events.append(event)
-    
-    event_bus.subscribe("test", capture_event)
-    
     # Create a response
     response = BrainResponse(
         text="Test response",
@@ -144,10 +199,12 @@ async def test_brain_publishes_system_action(brain_module, event_bus):
     # Publish the action
     await brain_module._publish_action(response)
     
-    # Verify event was published
-    assert len(published_events) == 1
-    event = published_events[0]
-    assert event.type == EventType.SYSTEM_ACTION
+    # Verify event was published. Check the captured types before indexing,
+    # since looking a type up in the defaultdict adds it.
+    assert set(captured_by_type) == {EventType.SYSTEM_ACTION}
+    action_events = captured_by_type[EventType.SYSTEM_ACTION]
+    assert len(action_events) == 1
+    event = action_events[0]
     assert event.source_module == "brain"
     assert event.payload["text"] == "Test response"
     assert event.payload["speak"] == "Hello"
@@ -155,37 +212,26 @@ async def test_brain_publishes_system_action(brain_module, event_bus):
 
 
 @pytest.mark.asyncio
-async def test_brain_handles_api_errors_gracefully(brain_module, event_bus):
+async def test_brain_handles_api_errors_gracefully(brain_module, captured_by_type, make_event):
     """Test that Brain handles API errors gracefully."""
-    # Track published events
-    published_events = []
-    
-    async def capture_event(event):
-        published_events.append(event)
-    
-    event_bus.subscribe("test", capture_event)
-    
-    # Mock the OpenAI client to raise an error
-    brain_module.client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
+    # Make the Gemini model raise an error
+    brain_module.model.error = Exception("API Error")
     
     # Create a vision event
-    vision_event = Event.create(
-        source_module="eye",
-        type=EventType.VISION_EVENT,
-        payload={"detected": True, "object_type": "face"}
-    )
+    vision_event = make_event(EventType.VISION_EVENT, {"detected": True, "object_type": "face"})
     
     # Process the event
     await brain_module.on_event(vision_event)
     
     # Should publish an ERROR event and a SYSTEM_ACTION with fallback text (graceful degradation)
-    error_events = [e for e in published_events if e.type == EventType.ACTION_ERROR]
-    action_events = [e for e in published_events if e.type == EventType.SYSTEM_ACTION]
+    assert set(captured_by_type) == {EventType.ACTION_ERROR, EventType.SYSTEM_ACTION}
+    error_events = captured_by_type[EventType.ACTION_ERROR]
+    action_events = captured_by_type[EventType.SYSTEM_ACTION]
     
     # Should have published an error event
     assert len(error_events) == 1
     assert error_events[0].payload["error_type"] == "external_service"
-    assert "OpenAI API call failed" in error_events[0].payload["message"]
+    assert "Gemini API call failed" in error_events[0].payload["message"]
     
     # Should also publish a SYSTEM_ACTION with fallback text for graceful degradation
     assert len(action_events) == 1
@@ -3,19 +3,45 @@ Unit tests for Eye Module.
 """
 
 import asyncio
-import base64
+import os
+import threading
+import time
+import pybase64 as base64
+from functools import lru_cache
 import pytest
 import cv2
 import numpy as np
-from backend.core.event_bus import EventBus, EventType
+from backend.core.event_bus import EventType
 from backend.core.module_registry import ModuleRegistry
+from backend.modules import eye
 from backend.modules.eye import EyeModule, FaceDetection, BoundingBox
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _cached_face_cascade():
+    """Load each face cascade once per thread instead of once per EyeModule."""
+    load_face_cascade = eye._load_face_cascade
+    
+    # Keyed on everything _load_face_cascade reads from the environment, and
+    # on the thread, since cascades are not safe to share across threads
+    @lru_cache(maxsize=16)
+    def load_cached(path, cuda_path, thread_id):
+        return load_face_cascade()
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            eye, "_load_face_cascade",
+            lambda: load_cached(
+                eye._cascade_path(), os.getenv("EYE_CUDA_CASCADE"), threading.get_ident()
+            )
+        )
+        yield
+
+
 @pytest.fixture
-def event_bus():
-    """Create an event bus for testing."""
-    return EventBus()
+def event_bus(bus):
+    """Provide the session event bus, reset to a fresh state for this test."""
+    return bus
 
 
 @pytest.fixture
@@ -24,36 +50,62 @@ def registry():
     return ModuleRegistry()
 
 
+@pytest.fixture(scope="module")
+def _shared_eye_module(session_bus):
+    """Build one Eye module for the whole file, so detectors load once."""
+    module = EyeModule(session_bus, ModuleRegistry())
+    yield module
+    module.shutdown()
+
+
 @pytest.fixture
-def eye_module(event_bus, registry):
-    """Create an Eye module for testing."""
-    return EyeModule(event_bus, registry)
+def eye_module(_shared_eye_module, event_bus, registry):
+    """Hand out the shared Eye module, bound to this test's bus and registry."""
+    module = _shared_eye_module
+    module.event_bus = event_bus
+    module.registry = registry
+    event_bus.subscribe(module.module_id, module._on_event)
+    module.reset_state()
+    # Settings some tests tune
+    settings = (module.min_publish_interval, module._max_batches_in_flight)
+    yield module
+    module.min_publish_interval, module._max_batches_in_flight = settings
+    module._pending_frames.clear()
 
 
-def create_test_image(width=640, height=480, with_face=False):
+@lru_cache(maxsize=None)
+def create_test_image(width=160, height=120, with_face=False):
     """
-    Create a test image as base64 string.
+    Create a grayscale test image as base64 string.
+    
+    Results are cached per (width, height, with_face), since the encoded
+    image is deterministic. The default size is small because detection cost
+    grows with pixel count and the tests don't depend on detection quality.
     
     Args:
         width: Image width
         height: Image height
         with_face: Whether to draw a simple face-like pattern
-        
+    
     Returns:
         Base64-encoded image string
     """
-    # Create a blank image
-    image = np.zeros((height, width, 3), dtype=np.uint8)
+    # Create a blank single-channel image: the Eye module decodes frames
+    # to grayscale for detection, so color planes would only add bytes
+    image = np.zeros((height, width), dtype=np.uint8)
     
     if with_face:
-        # Draw a simple face-like pattern (circle for head, rectangles for eyes)
-        center_x, center_y = width // 2, height // 2
-        cv2.circle(image, (center_x, center_y), 100, (255, 255, 255), -1)
-        cv2.rectangle(image, (center_x - 40, center_y - 20), (center_x - 20, center_y), (0, 0, 0), -1)
-        cv2.rectangle(image, (center_x + 20, center_y - 20), (center_x + 40, center_y), (0, 0, 0), -1)
+        # Draw a simple face-like pattern (square for head, rectangles for
+        # eyes) with slice fills, sized relative to a 640px wide frame
+        cx, cy = width // 2, height // 2
+        head, eye_near, eye_far, eye_h = (round(v * width / 640) for v in (100, 20, 40, 20))
+        image[cy - head:cy + head, cx - head:cx + head] = 255
+        image[cy - eye_h:cy, cx - eye_far:cx - eye_near] = 0
+        image[cy - eye_h:cy, cx + eye_near:cx + eye_far] = 0
     
-    # Encode to JPEG
-    _, buffer = cv2.imencode('.jpg', image)
+    # Encode to BMP: lossless and without entropy coding, so both encoding
+    # here and decoding in the Eye module are little more than a copy
+    _, buffer = cv2.imencode('.bmp', image)
     
     # Convert to base64
     image_base64 = base64.b64encode(buffer).decode('utf-8')
@@ -61,6 +113,20 @@ def create_test_image(width=640, height=480, with_face=False):
     return image_base64
 
 
+@pytest.fixture(scope="session")
+def test_image_b64():
+    """Blank 160x120 test frame as base64, encoded once per session."""
+    return create_test_image()
+
+
+@pytest.fixture(scope="session")
+def test_frame():
+    """Blank, read-only 160x120 BGR frame for tests that skip decoding."""
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    frame.flags.writeable = False
+    return frame
+
+
 @pytest.mark.asyncio
 async def test_eye_module_initialization(eye_module):
     """Test that Eye module initializes correctly."""
@@ -71,17 +137,15 @@ async def test_eye_module_initialization(eye_module):
 
 
 @pytest.mark.asyncio
-async def test_eye_module_processes_frame_when_enabled(eye_module, registry, event_bus):
+async def test_eye_module_processes_frame_when_enabled(eye_module, registry, event_bus, test_frame):
     """Test that Eye module processes frames when enabled."""
     # Enable the Eye module
     registry.toggle_module("eye")
     assert registry.is_enabled("eye")
     
-    # Create a test image
-    test_image = create_test_image()
-    
-    # Process the frame
-    await eye_module.process_frame(test_image)
+    # Process the frame (already decoded; decoding is covered by the
+    # base64 and raw bytes tests)
+    await eye_module.process_frame_array(test_frame)
     
     # Check that a VISION_EVENT was published
     events = event_bus.get_all_events()
@@ -92,16 +156,13 @@ async def test_eye_module_processes_frame_when_enabled(eye_module, registry, eve
 
 
 @pytest.mark.asyncio
-async def test_eye_module_ignores_frame_when_disabled(eye_module, registry, event_bus):
+async def test_eye_module_ignores_frame_when_disabled(eye_module, registry, event_bus, test_image_b64):
     """Test that Eye module does not process frames when disabled."""
     # Ensure Eye module is disabled
     assert not registry.is_enabled("eye")
     
-    # Create a test image
-    test_image = create_test_image()
-    
     # Process the frame
-    await eye_module.process_frame(test_image)
+    await eye_module.process_frame(test_image_b64)
     
     # Check that no events were published
     events = event_bus.get_all_events()
@@ -109,16 +170,13 @@ async def test_eye_module_ignores_frame_when_disabled(eye_module, registry, even
 
 
 @pytest.mark.asyncio
-async def test_eye_module_publishes_vision_event_structure(eye_module, registry, event_bus):
+async def test_eye_module_publishes_vision_event_structure(eye_module, registry, event_bus, test_frame):
     """Test that VISION_EVENT has correct structure."""
     # Enable the Eye module
     registry.toggle_module("eye")
     
-    # Create a test image
-    test_image = create_test_image()
-    
     # Process the frame
-    await eye_module.process_frame(test_image)
+    await eye_module.process_frame_array(test_frame)
     
     # Check event structure
     events = event_bus.get_all_events()
@@ -134,13 +192,10 @@ async def test_eye_module_publishes_vision_event_structure(eye_module, registry,
 
 
 @pytest.mark.asyncio
-async def test_detect_face_returns_face_detection(eye_module):
+async def test_detect_face_returns_face_detection(eye_module, test_frame):
     """Test that detect_face returns FaceDetection object."""
-    # Create a test image
-    image = np.zeros((480, 640, 3), dtype=np.uint8)
-    
     # Detect face
-    result = eye_module.detect_face(image)
+    result = eye_module.detect_face(test_frame)
     
     # Check result type
     assert isinstance(result, FaceDetection)
@@ -148,6 +203,17 @@ async def test_detect_face_returns_face_detection(eye_module):
     assert isinstance(result.confidence, float)
 
 
+@pytest.mark.asyncio
+async def test_detect_face_accepts_grayscale_image(eye_module):
+    """Test that detect_face works on frames decoded straight to grayscale."""
+    image = np.zeros((120, 160), dtype=np.uint8)
+    
+    result = eye_module.detect_face(image)
+    
+    assert isinstance(result, FaceDetection)
+    assert result.detected is False
+
+
 @pytest.mark.asyncio
 async def test_eye_module_handles_invalid_base64(eye_module, registry, event_bus):
     """Test that Eye module handles invalid base64 gracefully."""
@@ -174,14 +240,13 @@ async def test_eye_module_handles_invalid_base64(eye_module, registry, event_bus
 
 
 @pytest.mark.asyncio
-async def test_eye_module_handles_data_url_prefix(eye_module, registry, event_bus):
+async def test_eye_module_handles_data_url_prefix(eye_module, registry, event_bus, test_image_b64):
     """Test that Eye module handles data URL prefix correctly."""
     # Enable the Eye module
     registry.toggle_module("eye")
     
     # Create a test image with data URL prefix
-    test_image = create_test_image()
-    data_url = f"data:image/jpeg;base64,{test_image}"
+    data_url = f"data:image/bmp;base64,{test_image_b64}"
     
     # Process the frame
     await eye_module.process_frame(data_url)
@@ -190,3 +255,346 @@ async def test_eye_module_handles_data_url_prefix(eye_module, registry, event_bu
     events = event_bus.get_all_events()
     assert len(events) == 1
     assert events[0].type == EventType.VISION_EVENT
+
+
+@pytest.mark.asyncio
+async def test_eye_module_accepts_base64_as_bytes(eye_module, registry, event_bus, test_image_b64):
+    """Test that Eye module takes a base64 data URL given as ASCII bytes."""
+    registry.toggle_module("eye")
+    
+    await eye_module.process_frame(b"data:image/bmp;base64," + test_image_b64.encode("ascii"))
+    
+    events = event_bus.get_all_events()
+    assert len(events) == 1
+    assert events[0].type == EventType.VISION_EVENT
+
+
+@pytest.mark.asyncio
+async def test_eye_module_processes_raw_frame_bytes(eye_module, registry, event_bus, test_image_b64):
+    """Test that Eye module processes encoded image bytes without base64."""
+    # Enable the Eye module
+    registry.toggle_module("eye")
+    
+    # Create raw JPEG bytes
+    image_bytes = base64.b64decode(test_image_b64)
+    
+    # Process the frame
+    await eye_module.process_frame_bytes(image_bytes)
+    
+    # Check that a VISION_EVENT was published
+    events = event_bus.get_all_events()
+    assert len(events) == 1
+    assert events[0].type == EventType.VISION_EVENT
+    assert "detected" in events[0].payload
+
+
+@pytest.mark.asyncio
+async def test_eye_module_detects_in_process_pool(event_bus, registry, test_image_b64):
+    """Test that Eye module can run decoding and detection in a process pool."""
+    from backend.modules.eye import create_detection_pool
+    
+    pool = create_detection_pool(1)
+    try:
+        eye_module = EyeModule(event_bus, registry, executor=pool)
+        registry.toggle_module("eye")
+        
+        await eye_module.process_frame(test_image_b64)
+        
+        events = event_bus.get_all_events()
+        assert len(events) == 1
+        assert events[0].type == EventType.VISION_EVENT
+        assert events[0].payload["detected"] is False
+    finally:
+        pool.shutdown()
+
+
+def test_yunet_detection_uses_model_score_and_full_frame_coordinates():
+    """Test that YuNet results are mapped back to the original frame size."""
+    from backend.modules.eye import _find_face_yunet
+    
+    class FakeYuNet:
+        """Stand-in for cv2.FaceDetectorYN returning fixed detections."""
+        
+        def setInputSize(self, size):
+            self.input_size = size
+        
+        def detect(self, image):
+            faces = np.zeros((2, 15), dtype=np.float32)
+            faces[0, :4] = (10, 10, 20, 20)
+            faces[0, -1] = 0.7
+            faces[1, :4] = (40, 30, 80, 80)
+            faces[1, -1] = 0.9
+            return 1, faces
+    
+    detector = FakeYuNet()
+    # The fake ignores pixel values, so the frame needn't be zeroed
+    result = _find_face_yunet(detector, np.empty((480, 640, 3), dtype=np.uint8))
+    
+    # 640px frame is detected at 320px, so coordinates double
+    assert detector.input_size == (320, 240)
+    assert result.detected is True
+    assert result.confidence == pytest.approx(0.9)
+    assert (result.bounding_box.x, result.bounding_box.y) == (80, 60)
+    assert (result.bounding_box.width, result.bounding_box.height) == (160, 160)
+
+
+@pytest.mark.asyncio
+async def test_eye_module_skips_detection_for_repeated_frame(eye_module, registry, event_bus, monkeypatch, test_image_b64):
+    """Test that an identical re-sent frame reuses the previous detection."""
+    registry.toggle_module("eye")
+    image_bytes = base64.b64decode(test_image_b64)
+    
+    calls = []
+    original = eye.detect_face_in_bytes
+    
+    def counting_detect_face_in_bytes(data):
+        calls.append(data)
+        return original(data)
+    
+    monkeypatch.setattr(eye, "detect_face_in_bytes", counting_detect_face_in_bytes)
+    
+    await eye_module.process_frame_bytes(image_bytes)
+    await eye_module.process_frame_bytes(image_bytes)
+    
+    # Detection ran once; the repeat was filtered as a redundant event
+    assert len(calls) == 1
+    assert len(event_bus.get_all_events()) == 1
+    
+    # A different frame is processed again
+    await eye_module.process_frame_bytes(base64.b64decode(create_test_image(width=320, height=240)))
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_eye_module_reset_state_forgets_previous_frame(eye_module, registry, event_bus, test_image_b64):
+    """Test that reset_state lets a repeated frame publish again."""
+    registry.toggle_module("eye")
+    image_bytes = base64.b64decode(test_image_b64)
+    
+    await eye_module.process_frame_bytes(image_bytes)
+    eye_module.reset_state()
+    await eye_module.process_frame_bytes(image_bytes)
+    
+    # Without the reset the second frame would be filtered as redundant
+    assert len(event_bus.get_all_events()) == 2
+
+
+@pytest.mark.asyncio
+async def test_eye_module_processes_decoded_frame_array(eye_module, registry, event_bus, test_frame):
+    """Test that an already decoded frame is detected and published."""
+    registry.toggle_module("eye")
+    
+    await eye_module.process_frame_array(test_frame)
+    
+    events = event_bus.get_all_events()
+    assert len(events) == 1
+    assert events[0].type == EventType.VISION_EVENT
+    assert events[0].payload["detected"] is False
+
+
+@pytest.mark.asyncio
+async def test_eye_module_detects_off_the_event_loop(eye_module, registry, monkeypatch, test_image_b64):
+    """Test that decoding and detection run on the default thread pool."""
+    import threading
+    
+    registry.toggle_module("eye")
+    threads = []
+    original = eye.detect_face_in_bytes
+    
+    def recording_detect_face_in_bytes(data):
+        threads.append(threading.current_thread().name)
+        return original(data)
+    
+    monkeypatch.setattr(eye, "detect_face_in_bytes", recording_detect_face_in_bytes)
+    
+    await eye_module.process_frame(test_image_b64)
+    
+    assert len(threads) == 1
+    assert threads[0].startswith("eye-detect")
+
+
+@pytest.mark.asyncio
+async def test_eye_module_no_face_payloads_are_not_shared(eye_module, event_bus):
+    """Test that changing one no-face payload doesn't affect the next no-face event."""
+    eye_module.min_publish_interval = -1.0
+    
+    await eye_module._publish_vision_event(FaceDetection(detected=False))
+    event_bus.get_all_events()[0].payload["confidence"] = 1.0
+    await eye_module._publish_vision_event(FaceDetection(detected=False))
+    
+    assert event_bus.get_all_events()[1].payload["confidence"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_eye_module_reuses_payload_for_stable_face(eye_module, event_bus):
+    """Test that a face that barely moves republishes the cached payload's contents."""
+    eye_module.min_publish_interval = -1.0
+    
+    await eye_module._publish_vision_event(
+        FaceDetection(detected=True, confidence=0.5, bounding_box=BoundingBox(x=80, y=64, width=96, height=96))
+    )
+    await eye_module._publish_vision_event(
+        FaceDetection(detected=True, confidence=0.5, bounding_box=BoundingBox(x=82, y=65, width=97, height=98))
+    )
+    await eye_module._publish_vision_event(
+        FaceDetection(detected=True, confidence=0.5, bounding_box=BoundingBox(x=120, y=64, width=96, height=96))
+    )
+    
+    events = event_bus.get_all_events()
+    assert len(events) == 3
+    assert events[1].payload == events[0].payload
+    assert events[2].payload["bounding_box"]["x"] == 120
+
+
+@pytest.mark.asyncio
+async def test_eye_module_cached_face_payloads_are_not_shared(eye_module, event_bus):
+    """Test that changing one face payload doesn't affect the next event reusing it."""
+    eye_module.min_publish_interval = -1.0
+    detection = FaceDetection(detected=True, confidence=0.5, bounding_box=BoundingBox(x=80, y=64, width=96, height=96))
+    
+    await eye_module._publish_vision_event(detection)
+    first = event_bus.get_all_events()[0].payload
+    first["confidence"] = 1.0
+    first["bounding_box"]["x"] = 0
+    await eye_module._publish_vision_event(detection)
+    
+    second = event_bus.get_all_events()[1].payload
+    assert second["confidence"] == 0.5
+    assert second["bounding_box"]["x"] == 80
+
+
+def test_detect_faces_in_batch_maps_mosaic_detections_to_frames(monkeypatch):
+    """Test that one Haar pass over the mosaic yields per-frame results."""
+    class FakeCascade:
+        """Stand-in for the Haar cascade that records the mosaic it scans."""
+        
+        def detectMultiScale(self, gray, **kwargs):
+            self.shape = gray.shape
+            # One face in the second tile (starts at 320 + 24 gap = 344)
+            return np.array([[344 + 40, 30, 80, 80]])
+    
+    cascade = FakeCascade()
+    eye.init_detection_worker(None)
+    monkeypatch.setattr(eye._worker, "cascade", cascade)
+    
+    # Full-size frames: the assertions below depend on the downscaling
+    full_frame = base64.b64decode(create_test_image(width=640, height=480))
+    frames = [
+        full_frame,
+        full_frame,
+        b"not an image",
+    ]
+    results = eye.detect_faces_in_batch(frames)
+    
+    # Two 640x480 frames downscaled to 320x240 and tiled with a gap
+    assert cascade.shape == (240, 320 * 2 + 24)
+    assert results[0].detected is False
+    assert results[1].detected is True
+    assert (results[1].bounding_box.x, results[1].bounding_box.y) == (80, 60)
+    assert results[1].bounding_box.width == 160
+    assert results[2] is None
+
+
+def test_detect_faces_in_batch_drops_detections_spanning_tiles(monkeypatch):
+    """Test that a Haar window straddling two mosaic tiles isn't reported as a face."""
+    class FakeCascade:
+        """Stand-in for the Haar cascade with one window across the gap."""
+        
+        def detectMultiScale(self, gray, **kwargs):
+            # The first tile ends at 320, the second starts at 344
+            return np.array([[280, 30, 100, 100]])
+    
+    eye.init_detection_worker(None)
+    monkeypatch.setattr(eye._worker, "cascade", FakeCascade())
+    
+    full_frame = base64.b64decode(create_test_image(width=640, height=480))
+    results = eye.detect_faces_in_batch([full_frame, full_frame])
+    
+    assert [result.detected for result in results] == [False, False]
+
+
+def test_detect_faces_in_batch_matches_single_frame_for_reduced_decodes(monkeypatch):
+    """Test that batch and single-frame detection agree when decoding shrinks the frame."""
+    class FakeCascade:
+        """Stand-in for the Haar cascade with one face in the first tile."""
+        
+        def detectMultiScale(self, gray, **kwargs):
+            return np.array([[40, 30, 80, 80]])
+    
+    eye.init_detection_worker(None)
+    monkeypatch.setattr(eye._worker, "cascade", FakeCascade())
+    # A 1280x960 frame decoded at a quarter of its size
+    monkeypatch.setattr(eye, "_decode_gray", lambda data: (np.zeros((240, 320), np.uint8), 4.0))
+    
+    single = eye.detect_face_in_bytes(b"frame")
+    batch = eye.detect_faces_in_batch([b"frame", b"frame"])
+    
+    assert batch[0].confidence == pytest.approx(single.confidence)
+    assert batch[0].bounding_box == single.bounding_box
+
+
+@pytest.mark.asyncio
+async def test_eye_module_batches_frames_while_pool_is_busy(eye_module, registry, monkeypatch):
+    """Test that frames queued behind a running detection are batched."""
+    registry.toggle_module("eye")
+    eye_module._max_batches_in_flight = 1
+    batch_sizes = []
+    original = eye.detect_faces_in_batch
+    
+    def recording_detect_faces_in_batch(frames):
+        batch_sizes.append(len(frames))
+        return original(frames)
+    
+    monkeypatch.setattr(eye, "detect_faces_in_batch", recording_detect_faces_in_batch)
+    
+    await asyncio.gather(*(
+        eye_module.process_frame(create_test_image(width=320 + i, height=240))
+        for i in range(3)
+    ))
+    
+    # The first frame ran on its own; the two queued behind it shared a batch
+    assert batch_sizes == [2]
+
+
+def test_detector_setting_selects_cascade_over_yunet(monkeypatch, tmp_path):
+    """Test that EYE_DETECTOR can force a cascade even with a YuNet model present."""
+    model = tmp_path / "yunet.onnx"
+    model.write_bytes(b"")
+    monkeypatch.setenv("EYE_YUNET_MODEL", str(model))
+    
+    monkeypatch.setenv("EYE_DETECTOR", "auto")
+    assert eye._yunet_model_path() == str(model)
+    
+    monkeypatch.setenv("EYE_DETECTOR", "haar")
+    assert eye._yunet_model_path() is None
+    
+    # A missing LBP cascade falls back to Haar
+    monkeypatch.setenv("EYE_DETECTOR", "lbp")
+    monkeypatch.setenv("EYE_LBP_CASCADE", str(tmp_path / "missing.xml"))
+    assert eye._yunet_model_path() is None
+    assert eye._cascade_path().endswith("haarcascade_frontalface_default.xml")
+
+
+# Upper bound for process_frame on a repeated frame, in nanoseconds per
+# base64 byte (about 0.4 with pybase64; several times that means decoding
+# or detection has crept back into the repeated-frame path)
+MAX_NS_PER_BYTE = 2.0
+
+
+@pytest.mark.perf
+@pytest.mark.asyncio
+async def test_process_frame_throughput(eye_module, registry, test_image_b64):
+    """Benchmark base64 frame intake against MAX_NS_PER_BYTE."""
+    registry.toggle_module("eye")
+    runs = 1000
+    
+    # Prime the repeated-frame cache so only intake is measured
+    await eye_module.process_frame(test_image_b64)
+    
+    start = time.perf_counter_ns()
+    for _ in range(runs):
+        await eye_module.process_frame(test_image_b64)
+    elapsed_ns = time.perf_counter_ns() - start
+    
+    ns_per_byte = elapsed_ns / (runs * len(test_image_b64))
+    assert ns_per_byte < MAX_NS_PER_BYTE
@@ -103,11 +103,11 @@ function App() {
 
 
   // Handle webcam frame capture and send to backend
-  const handleFrame = async (frameData: string) => {
+  const handleFrame = async (frame: Blob) => {
     if (!eyeEnabled) return;
 
     try {
-      await apiClient.processVisionFrame({ frame: frameData });
+      await apiClient.processVisionFrameBinary(frame);
     } catch (err) {
       console.error("Failed to process vision frame:", err);
     }
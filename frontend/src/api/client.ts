@@ -70,6 +70,15 @@ class ApiClient {
     });
   }
 
+  // Process a vision frame sent as raw encoded image bytes (no base64)
+  async processVisionFrameBinary(frame: Blob): Promise<VisionFrameResponse> {
+    return this.request<VisionFrameResponse>("/vision/frame-binary", {
+      method: "POST",
+      body: frame,
+      headers: { "Content-Type": "application/octet-stream" },
+    });
+  }
+
   // Get event logs
   async getLogs(limit: number = 50): Promise<Event[]> {
     return this.request<Event[]>(`/logs?limit=${limit}`);
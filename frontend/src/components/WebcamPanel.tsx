@@ -5,7 +5,7 @@ import type { VisionEventPayload } from "../types";
 
 interface WebcamPanelProps {
   eyeEnabled: boolean;
-  onFrame?: (frameData: string) => void;
+  onFrame?: (frame: Blob) => void;
   detections?: VisionEventPayload[];
 }
 
@@ -114,9 +114,14 @@ export function WebcamPanel({
     // Draw current video frame to canvas
     ctx.drawImage(video, 0, 0, canvas.width, canvas.height);
 
-    // Convert to base64
-    const frameData = canvas.toDataURL("image/jpeg", 0.8);
-    onFrame(frameData);
+    // Encode as a binary JPEG (no base64 inflation)
+    canvas.toBlob(
+      (frame) => {
+        if (frame) onFrame(frame);
+      },
+      "image/jpeg",
+      0.8
+    );
   };
 
   // Draw bounding boxes for detected faces